@@ -1,57 +1,102 @@
 
+import logging
 import os
-from trivox_conductor.core.registry.base_loader import load_descriptors, import_adapter_from_descriptor
-from trivox_conductor.core.registry.capture_registry import CaptureRegistry
-from trivox_conductor.core.registry.watcher_registry import WatcherRegistry
-    # ... set others
+import sys
 
-from trivox_conductor.common.module_loader import load_all_modules
-from trivox_conductor.common.logging import setup_logging
 from trivox_conductor.common.logger import logger
 
-# ... import other registries
+# Overrides applied on top of the default logging spec. Built once; logging is
+# only (re)configured through dictConfig on the first `initialize()` call.
+_LOG_OVERRIDES = {
+    "handlers": {
+        "file": {
+            "maxBytes": 10485760,
+            "backupCount": 5,
+        },
+    },
+    "root": {"level": "INFO"},
+    "loggers": {
+        "trivox_conductor": {
+            "level": "DEBUG",
+            "propagate": True,
+        },
+    },
+}
+_logging_configured = False
+
+# Justification: The loaders, registries and logging setup are imported inside
+# the functions that use them so importing this module (e.g. from the CLI entry
+# point) stays cheap until the application is actually initialized.
+# pylint: disable=import-outside-toplevel
+
 
 def load_local_plugins(pkg_root="trivox_conductor"):
+    from trivox_conductor.core.registry.base_loader import (
+        import_adapter_from_descriptor,
+        load_descriptors,
+    )
+    from trivox_conductor.core.registry.capture_registry import CaptureRegistry
+    from trivox_conductor.core.registry.watcher_registry import WatcherRegistry
+    # ... import other registries
+
+    # Register into the right registry (name + class!)
+    role_registries = {
+        "capture": CaptureRegistry,
+        "watcher": WatcherRegistry,
+        # TODO: add mux/color/uploader/notifier/ai when you add their plugins
+    }
+
     plugins_root = os.path.join(os.path.dirname(__file__), "plugins")
     descs = load_descriptors(os.path.abspath(plugins_root))
-    logger.debug(f"Plugin descriptors loaded: {descs}")
+    logger.debug("Plugin descriptors loaded: %s", descs)
+    batches = {role: [] for role in role_registries}
     for d in descs:
+        batch = batches.get(d.role)
+        if batch is None:
+            logger.debug("Skipping plugin %s: unknown role %s", d.name, d.role)
+            continue
         clazz = import_adapter_from_descriptor(d, pkg_root=pkg_root)
-        name = clazz.__name__.lower()
-
-        # Register into the right registry (name + class!)
-        if d.role == "capture":
-            CaptureRegistry.register(name, clazz)
-        elif d.role == "watcher":
-            WatcherRegistry.register(name, clazz)
-        # TODO: add mux/color/uploader/notifier/ai when you add their plugins
+        batch.append((sys.intern(clazz.__name__.lower()), clazz))
+    for role, pairs in batches.items():
+        if pairs:
+            role_registries[role].register_many(pairs)
 
     # choose actives (from settings)
     CaptureRegistry.set_active("obsadapter")        # class name lower() by default
     WatcherRegistry.set_active("replaywatcheradapter")
 
 
+def configure_logging():
+    """
+    Configure logging for the application.
+
+    The first call builds the handlers through dictConfig. Later calls (e.g.
+    in-process re-initialization) keep the existing handlers and only restore
+    the configured levels.
+    """
+    global _logging_configured  # pylint: disable=global-statement
+    if _logging_configured:
+        logging.getLogger().setLevel(_LOG_OVERRIDES["root"]["level"])
+        for name, cfg in _LOG_OVERRIDES["loggers"].items():
+            logging.getLogger(name).setLevel(cfg["level"])
+        return
+
+    from trivox_conductor.common.logging import setup_logging
+
+    setup_logging(overrides=_LOG_OVERRIDES)
+    _logging_configured = True
+
+
 def initialize():
-    setup_logging(
-        overrides={
-            "handlers": {
-                "file": {
-                    "maxBytes": 10485760,
-                    "backupCount": 5,
-                },
-            },
-            "root": {"level": "INFO"},
-            "loggers": {
-                "trivox_conductor": {
-                    "level": "DEBUG",
-                    "propagate": True,
-                },
-            },
-        }
-    )
+    from trivox_conductor.common.module_loader import load_all_modules
+
+    configure_logging()
     load_all_modules()
     load_local_plugins()
     logger.info("Trivox Conductor application started.")
 
+
+# pylint: enable=import-outside-toplevel
+
 if __name__ == "__main__":
     initialize()
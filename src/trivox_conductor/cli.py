@@ -6,8 +6,70 @@ import sys
 import argparse
 
 from trivox_conductor.common.commands import BaseCLIApp, CLIConfig
-from trivox_conductor.app import initialize
-from trivox_conductor.ui import run_gui
+from trivox_conductor.common.module_loader import precompile_modules
+
+# Resolved on first use so non-GUI commands never import the Qt stack.
+_run_gui: Optional[Callable[..., None]] = None
+
+
+def _load_run_gui() -> Callable[..., None]:
+    """
+    Import the GUI entry point on first use.
+
+    :return: The callback that launches the GUI application.
+    :rtype: Callable[..., None]
+    """
+    global _run_gui  # pylint: disable=global-statement
+    if _run_gui is None:
+        # Justification: Deferred so `--help` and non-GUI commands skip PySide6.
+        # pylint: disable=import-outside-toplevel
+        from trivox_conductor.ui import run_gui
+
+        _run_gui = run_gui
+    return _run_gui
+
+
+def _invoke_gui(
+    gui_callback: Optional[Callable[..., None]], kwargs: dict
+) -> int:
+    """
+    Launch the GUI and map any failure to exit code 1.
+
+    :param gui_callback: The configured GUI callback, or None to use run_gui.
+    :type gui_callback: Optional[Callable[..., None]]
+
+    :param kwargs: Keyword arguments forwarded to the callback.
+    :type kwargs: dict
+
+    :return: The exit code.
+    :rtype: int
+    """
+    try:
+        (gui_callback or _load_run_gui())(**kwargs)
+        return 0
+    # Justification: Broad exception caught to handle any error from the GUI launch
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        print(f"Error launching GUI: {e}", file=sys.stderr)
+        return 1
+    # pylint: enable=broad-exception-caught
+
+
+def _package_version() -> str:
+    """
+    Read the installed distribution version.
+
+    :return: The version, or "unknown" when running from an uninstalled tree.
+    :rtype: str
+    """
+    # Justification: importlib.metadata is only needed by the entry point.
+    # pylint: disable=import-outside-toplevel
+    from importlib import metadata
+
+    try:
+        return metadata.version("trivox-conductor")
+    except metadata.PackageNotFoundError:
+        return "unknown"
 
 
 class TrivoxCLI(BaseCLIApp):
@@ -17,12 +79,16 @@ class TrivoxCLI(BaseCLIApp):
     ):
         """
         :param gui_callback: The callback function to run the GUI application.
+            When omitted, the GUI is imported lazily the first time it is run.
         :type gui_callback: Optional[Callable[[], None]]
         """
 
         self.gui_callback = gui_callback
         super().__init__(config)
-        self._add_run_command(self.subparsers)
+
+    def _add_builtin_commands(self, subparsers: argparse._SubParsersAction):
+        self._add_run_command(subparsers)
+        self._add_warmup_command(subparsers)
 
     def _add_run_command(self, subparsers: argparse._SubParsersAction):
         subparsers.add_parser(
@@ -31,6 +97,16 @@ class TrivoxCLI(BaseCLIApp):
             description="Launch the Trivox Conductor GUI application.",
         )
 
+    def _add_warmup_command(self, subparsers: argparse._SubParsersAction):
+        subparsers.add_parser(
+            "warmup",
+            help="Precompile the Trivox Conductor bytecode cache.",
+            description=(
+                "Byte-compile the modules loaded at startup so later runs "
+                "skip compiling them."
+            ),
+        )
+
     def run_command(self, args: argparse.Namespace):
         """
         Run the command based on the parsed arguments.
@@ -41,28 +117,17 @@ class TrivoxCLI(BaseCLIApp):
         :param run_callback: The callback function to run the command.
         :type run_callback: callable
         """
-        if not getattr(args, "command", None):
+        # Always present: the subparsers action uses dest="command".
+        if not args.command:
             self.parser.print_help()
             return 1
 
         if args.command == "run":
-            if not self.gui_callback:
-                print(
-                    "Error: GUI callback is not configured.", file=sys.stderr
-                )
-                return 2
-            kw = vars(args).copy()
-            kw.pop("command", None)
-            # Let GUI callback raise; map to exit code 1 on failure
-            try:
-                self.gui_callback(**kw)
-                return 0
-            # Justification: Broad exception caught to handle any error from the GUI launch
-            # pylint: disable=broad-exception-caught
-            except Exception as e:
-                print(f"Error launching GUI: {e}", file=sys.stderr)
-                return 1
-            # pylint: enable=broad-exception-caught
+            kw = {k: v for k, v in vars(args).items() if k != "command"}
+            return _invoke_gui(self.gui_callback, kw)
+
+        if args.command == "warmup":
+            return 0 if precompile_modules() else 1
 
         # For all other commands, defer to base logic (registry-driven)
         return super().run_command(args)
@@ -73,28 +138,36 @@ def main():
     Main entry point for the CLI application.
 
     - Load all modules to register commands, settings, and strategies.
-    - Populate settings and setup the logger.
+    - Populate settings and setup the logger (skipped for ``warmup``).
     - Parse the command line arguments.
     """
 
-    # Load all modules to register commands, settings, and strategies.
-    
-    # Populate settings and setup the logger
-    initialize()
+    argv = sys.argv[1:]
+    # warmup only byte-compiles files, so it skips the bootstrap: it must
+    # work even when a plugin dependency is missing. The main parser only
+    # has flag options, so the first positional token is the command.
+    if next((a for a in argv if not a.startswith("-")), None) != "warmup":
+        # Justification: Only the entry point needs the bootstrap, so
+        # importing TrivoxCLI alone stays cheap.
+        # pylint: disable=import-outside-toplevel
+        from trivox_conductor.app import initialize
+
+        # Load all modules to register commands, settings, and strategies.
+        # Populate settings and setup the logger
+        initialize()
     # Parse the command line arguments
     cli_app = TrivoxCLI(
         config=CLIConfig(
             app_name="trivox_conductor",
+            version=f"%(prog)s {_package_version()}",
             description="Trivox Conductor CLI Application",
             usage="""
             DEV: python manage.py <command> [<args>]
             PROD: trivox_conductor <command> [<args>]
             """,
         ),
-        gui_callback=run_gui,
     )
-    args = cli_app.parse_args()
-    cli_app.run_command(args)
+    sys.exit(cli_app.run(argv))
 
 
 if __name__ == "__main__":
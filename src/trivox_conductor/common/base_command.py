@@ -5,7 +5,8 @@ This module defines the TrivoxConductorCommand class, which serves as a base for
 ic_ingest commands.
 """
 
-from typing import List, Optional
+import logging
+from typing import Dict, List, Optional, Set, Tuple, Type
 
 from trivox_conductor.common.commands.base_command import BaseCommand
 from trivox_conductor.common.commands.exceptions import CommandException
@@ -13,6 +14,7 @@ from trivox_conductor.common.commands.argument_type import ArgumentType
 from trivox_conductor.common.commands.base_command_processor import BaseCommandProcessor
 
 from trivox_conductor.common.logger import logger
+from trivox_conductor.common.logging.class_logger import get_class_logger
 
 
 class TrivoxConductorCommand(BaseCommand):
@@ -22,6 +24,9 @@ class TrivoxConductorCommand(BaseCommand):
 
     processor: Optional[BaseCommandProcessor] = None
 
+    # Processor classes that already passed the subclass check.
+    _VALIDATED_PROCESSORS: Set[Type[BaseCommandProcessor]] = set()
+
     _COMMON_ARGS: List[ArgumentType] = [
         ArgumentType(
             "config",
@@ -30,19 +35,30 @@ class TrivoxConductorCommand(BaseCommand):
             required=False,
         ),
     ]
+    _COMMON_ARGS_BY_NAME: Dict[str, ArgumentType] = {
+        a.name: a for a in _COMMON_ARGS
+    }
 
     @classmethod
-    def define_arguments(cls) -> List[ArgumentType]:
+    def define_arguments(cls) -> Tuple[ArgumentType, ...]:
         """
         Merge command-specific args with common flags.
         Ensures no duplicate names if a command defines its own.
+
+        The merged tuple is computed once per command class and cached on it.
         """
-        specific = list(cls.args or [])
+        cached = cls.__dict__.get("_merged_args")
+        if cached is not None:
+            return cached
+
+        specific = tuple(cls.args or ())
         existing = {a.name for a in specific}
-        merged = specific[:]
-        for common in cls._COMMON_ARGS:
-            if common.name not in existing:
-                merged.append(common)
+        merged = specific + tuple(
+            common
+            for name, common in cls._COMMON_ARGS_BY_NAME.items()
+            if name not in existing
+        )
+        cls._merged_args = merged
         return merged
 
     def set_verbose(self, verbose: bool):
@@ -52,10 +68,14 @@ class TrivoxConductorCommand(BaseCommand):
         :param verbose: Whether to enable verbose mode.
         :type verbose: bool
         """
-        if verbose:
-            logger.setLevel("DEBUG")
-            logger.debug("Verbose mode enabled")
-            logger.debug(f"Executing {self.name} in verbose mode: {verbose}")
+        if not verbose:
+            return
+        log = get_class_logger(self)
+        # setLevel clears the level cache of every logger; skip it if unneeded.
+        if logger.getEffectiveLevel() > logging.DEBUG:
+            logger.setLevel(logging.DEBUG)
+        log.debug("Verbose mode enabled")
+        log.debug("Executing %s in verbose mode: %s", self.name, verbose)
 
     def set_processor(self, processor: BaseCommandProcessor):
         """
@@ -64,10 +84,14 @@ class TrivoxConductorCommand(BaseCommand):
         :param processor: The processor for the command.
         :type processor: BaseCommandProcessor
         """
-        if not issubclass(processor, BaseCommandProcessor):
-            raise CommandException(
-                f"Processor {processor} is not a subclass of BaseCommandProcessor"
-            )
+        # Debug-only sanity check: stripped under `python -O`, and done once
+        # per processor class otherwise.
+        if __debug__ and processor not in self._VALIDATED_PROCESSORS:
+            if not issubclass(processor, BaseCommandProcessor):
+                raise CommandException(
+                    f"Processor {processor} is not a subclass of BaseCommandProcessor"
+                )
+            self._VALIDATED_PROCESSORS.add(processor)
 
         self.processor = processor
 
@@ -75,14 +99,15 @@ class TrivoxConductorCommand(BaseCommand):
         """
         Run the command.
         """
+        log = get_class_logger(self)
         if not self.processor:
-            logger.error("No processor set for the command")
+            log.error("No processor set for the command")
             raise CommandException("Processor must be set")
 
-        logger.debug(f"Initializing processor: {self.processor}")
+        log.debug("Initializing processor: %s", self.processor)
         processor_instance: BaseCommandProcessor = self.processor(**kwargs)
-        logger.debug(
-            f"Running processor: {processor_instance.__class__.__name__}"
+        log.debug(
+            "Running processor: %s", processor_instance.__class__.__name__
         )
         return processor_instance.run()
 
@@ -90,6 +115,6 @@ class TrivoxConductorCommand(BaseCommand):
         """
         Execute the command.
         """
-        verbose = kwargs.pop("verbose", False)
-        self.set_verbose(verbose)
+        if kwargs.pop("verbose", False):
+            self.set_verbose(True)
         return self._execute(**kwargs)
@@ -1,11 +1,85 @@
+import sys
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional
 
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.common.commands.base_command_processor import BaseCommandProcessor
 
 
 class TrivoxCaptureCommandProcessor(BaseCommandProcessor):
     """
     Command processor for Trivox Capture commands.
+
+    Subclasses map each action to the name of a handler method in
+    ``ACTION_MAP`` and build the service those handlers act on in
+    :meth:`build_service`. Handlers receive the service as their only
+    argument.
     """
-    
+
+    __slots__ = ("_action", "_service")
+
+    ROLE: str = ""
+    ACTION_MAP: Dict[str, str] = {}
+    _resolved_actions: Dict[str, Callable[[Any], Callable[[Any], Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Interned keys/handler names let dict lookups and getattr hit the
+        # identity fast path.
+        cls.ROLE = sys.intern(cls.ROLE)
+        cls.ACTION_MAP = {
+            sys.intern(action): sys.intern(name)
+            for action, name in cls.ACTION_MAP.items()
+        }
+        # Resolve handler names once per class; run() only calls the getter.
+        cls._resolved_actions = {
+            action: attrgetter(name) for action, name in cls.ACTION_MAP.items()
+        }
+
     def __init__(self, **kwargs):
-        pass
\ No newline at end of file
+        action = kwargs.get("action", "")
+        # Parsed from argv, so a fresh string; intern it to match the keys.
+        self._action: str = (
+            sys.intern(action) if isinstance(action, str) else action
+        )
+        self._service: Optional[Any] = None
+
+    def build_service(self) -> Any:
+        """
+        Build the service the action handlers operate on.
+
+        Implementations import their service module inside this method:
+        services pull in adapters and contracts, so importing them is
+        deferred until an action actually runs.
+
+        :return: The service instance.
+        :rtype: Any
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def run(self):
+        get_class_logger(self).debug("Running %s", type(self).__name__)
+
+        getter = self._resolved_actions.get(self._action)
+        if getter is None:
+            raise ValueError(f"Unknown action: {self._action}")
+
+        # Built once per processor, and only for known actions, since service
+        # construction may do I/O.
+        if self._service is None:
+            self._service = self.build_service()
+
+        result = getter(self)(self._service)
+        self._log_action(result)
+        return result
+
+    def _log_action(self, result: Any) -> None:
+        """
+        Log a concise audit line for the executed action.
+
+        :param result: The value returned by the action handler.
+        :type result: Any
+        """
+        get_class_logger(self).info(
+            "%s.action - %s - %s", self.ROLE, self._action, result
+        )
@@ -9,16 +9,21 @@ Types module for command arguments.
 
 import argparse
 import json
-from dataclasses import dataclass
-from typing import List, Optional, Type, Union
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional, Tuple, Type, Union
 
 JSON = object()
 
 
-@dataclass
+@dataclass(frozen=True)
 class ArgumentType:
     """
     Represents an argument for a command.
+
+    Instances are immutable: they are declared once on command classes and
+    shared by every parser built from them.
     """
 
     name: str
@@ -39,9 +44,29 @@ class ArgumentType:
         :rtype: dict
         """
 
-        return dict(self.__dict__)
+        return dict(zip(_ARGUMENT_FIELDS, _get_argument_fields(self)))
+
+
+_ARGUMENT_FIELDS = tuple(f.name for f in fields(ArgumentType))
+_get_argument_fields = attrgetter(*_ARGUMENT_FIELDS)
+
+
+def _coerce_json(s: str):
+    """
+    Parse a command line value as JSON.
+
+    :param s: The raw command line value.
+    :type s: str
 
+    :return: The decoded JSON value.
+    """
+    try:
+        return json.loads(s)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"Invalid JSON: {e}")
 
+
+@lru_cache(maxsize=None)
 def coerce_type(t: Type[Union[str, int, float, bool]]) -> callable:
     """
     Coerce a type to a callable that converts a string to that type.
@@ -52,12 +77,45 @@ def coerce_type(t: Type[Union[str, int, float, bool]]) -> callable:
     :return: A callable that converts a string to the specified type.
     :rtype: callable
     """
-    def _coerce_json(s):
-        try:
-            return json.loads(s)
-        except json.JSONDecodeError as e:
-            raise argparse.ArgumentTypeError(f"Invalid JSON: {e}")
-
     if t is JSON:
         return _coerce_json
     return t
+
+
+def compile_argument(arg: ArgumentType) -> Tuple[str, dict, Optional[str]]:
+    """
+    Translate an argument into its ``add_argument`` flag and keyword arguments.
+
+    The environment default is returned separately so it is read on every
+    parse, not when the argument is compiled.
+
+    :param arg: The argument to compile.
+    :type arg: ArgumentType
+
+    :return: The flag, the keyword arguments and the environment variable
+        providing the default (None when not applicable).
+    :rtype: Tuple[str, dict, Optional[str]]
+    """
+    if arg.data_type is bool and arg.required:
+        raise ValueError(f"Boolean flag --{arg.name} cannot be required")
+
+    kwargs = {
+        "help": arg.help_text,
+        "required": arg.required,
+        "default": arg.default,
+    }
+    if arg.choices:
+        kwargs["choices"] = arg.choices
+    if arg.nargs is not None:
+        kwargs["nargs"] = arg.nargs
+    if arg.metavar:
+        kwargs["metavar"] = arg.metavar
+
+    ty = coerce_type(arg.data_type)
+    if ty is bool:
+        kwargs["action"] = "store_true"
+    else:
+        kwargs["type"] = ty
+
+    env = arg.env if arg.env and arg.default is None else None
+    return f"--{arg.name}", kwargs, env
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
-from .argument_type import ArgumentType
+from .argument_type import ArgumentType, compile_argument
 from .registry import CommandRegistry  # safe: we don't register on import
 
 
@@ -28,16 +28,38 @@ class BaseCommand(ABC):
     aliases: Tuple[str, ...] = ()
     summary: Optional[str] = None
     epilog: Optional[str] = None
-    args: Optional[List[ArgumentType]] = None
+    args: Optional[Sequence[ArgumentType]] = ()
     abstract: bool = False  # if True, decorator will skip registration
 
+    # Help metadata derived by CommandRegistry.register
+    _cached_doc: str = ""
+    _cached_summary: Optional[str] = None
+    _cached_aliases: Tuple[str, ...] = ()
+
     # Keep __init_subclass__ empty to avoid import/registration cycles
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
     @classmethod
-    def define_arguments(cls) -> List[ArgumentType]:
-        return list(cls.args or [])
+    def define_arguments(cls) -> Sequence[ArgumentType]:
+        # Class-level and shared: callers that need to mutate must copy.
+        return cls.args or ()
+
+    @classmethod
+    def compiled_arguments(cls) -> Tuple[Tuple[str, dict, Optional[str]], ...]:
+        """
+        ``add_argument`` specs for this command, compiled once per class.
+
+        :return: The (flag, kwargs, env) triples of the command arguments.
+        :rtype: Tuple[Tuple[str, dict, Optional[str]], ...]
+        """
+        compiled = cls.__dict__.get("_compiled_args")
+        if compiled is None:
+            compiled = tuple(
+                compile_argument(arg) for arg in cls.define_arguments()
+            )
+            cls._compiled_args = compiled
+        return compiled
 
     def validate(self, **kwargs):
         """Optional argument validation hook."""
@@ -52,11 +74,10 @@ class BaseCommand(ABC):
     def _execute(self, **kwargs):
         """Internal execution step (core logic)."""
 
-    @abstractmethod
     def execute(self, **kwargs):
         """External command entrypoint."""
-        # typical pattern: self.validate(...); self._run(...); return self._execute(...)
-        raise NotImplementedError
+        # BaseCLIApp.run_command validates first; _execute drives _run.
+        return self._execute(**kwargs)
 
 
 # Bind the endpoint_base now that BaseCommand exists (avoids circular import issues)
@@ -81,5 +102,6 @@ def register_command(
             impl_cls.name = resolved
         if aliases:
             impl_cls.aliases = aliases
+        impl_cls.compiled_arguments()
         return CommandRegistry.endpoint(resolved, replace=replace)(impl_cls)
     return deco
@@ -5,16 +5,19 @@ This module defines the BaseCommandProcessor class, which serves as a base for a
 command processors in the ic_ingest application.
 """
 
-from abc import ABC, abstractmethod
 from typing import Optional, Any
 
 
-class BaseCommandProcessor(ABC):
+class BaseCommandProcessor:
     """
     Base command processor class
+
+    A plain base class rather than an ABC: the contract is the single
+    :meth:`run` method, and instantiation skips the ABCMeta checks.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def run(self) -> Optional[Any]:
         """
         Run the command processor.
@@ -5,28 +5,90 @@ Command line interface for the IC Inspector tool.
 import argparse
 import os
 import sys
+from types import MappingProxyType
 from dataclasses import dataclass
-from typing import List, Optional, Type
+from functools import cached_property, lru_cache
+from typing import ClassVar, Dict, List, Mapping, Optional, Tuple, Type
 
 from .base_command import BaseCommand
 from .exceptions import CommandException
 from .registry import CommandRegistry
-from .argument_type import coerce_type
 
+# Help formatter shared by the main parser default and every subparser.
+_FMT = argparse.RawDescriptionHelpFormatter
 
-@dataclass
+
+@dataclass(frozen=True)
 class CLIConfig:
     """
     Configuration for the CLI application.
+
+    Frozen so it can key the shared parser cache.
     """
 
     app_name: Optional[str] = None
     version: Optional[str] = None
     description: Optional[str] = None
     usage: Optional[str] = None
-    formatter_class: Optional[Type[argparse.HelpFormatter]] = (
-        argparse.RawDescriptionHelpFormatter
-    )
+    formatter_class: Optional[Type[argparse.HelpFormatter]] = _FMT
+
+
+# (command_cls, summary, description, aliases) per primary command name.
+_CommandMetadata = Tuple[
+    Type[BaseCommand],
+    Optional[str],
+    Optional[str],
+    tuple,
+]
+
+
+@lru_cache(maxsize=1)
+def _command_metadata(version: int) -> Mapping[str, _CommandMetadata]:
+    """
+    Build the subparser metadata for every registered command.
+
+    Cached per registry version; the help texts themselves are derived once,
+    at registration (see ``CommandRegistry.register``). The snapshot is
+    read-only and keyed by interned names.
+
+    :param version: The CommandRegistry version the metadata is built for.
+    :type version: int
+
+    :return: The metadata keyed by primary command name.
+    :rtype: Mapping[str, _CommandMetadata]
+    """
+    # Justification: `version` is only the cache key, and the _cached_*
+    # attributes are written by CommandRegistry.register.
+    # pylint: disable=unused-argument,protected-access
+    metadata = {}
+    for command_name, command_cls in CommandRegistry.items():
+        summary = command_cls._cached_summary
+        metadata[sys.intern(command_name)] = (
+            command_cls,
+            summary,
+            command_cls._cached_doc or summary,
+            command_cls._cached_aliases,
+        )
+    return MappingProxyType(metadata)
+
+
+# Top-level help flags; help for a command goes through normal parsing.
+_HELP_FLAGS = frozenset({"-h", "--help"})
+
+# Namespace entries used for dispatch, not passed on to commands.
+_DISPATCH_KEYS = frozenset({"command", "_command_cls"})
+
+
+# (dest, environment variable) of the arguments defaulting from the env
+_EnvDefaults = Tuple[Tuple[str, str], ...]
+
+# (main parser, its subparsers action, attached registry command name ->
+# its env-backed arguments)
+_ParserBundle = Tuple[
+    argparse.ArgumentParser,
+    argparse._SubParsersAction,
+    Dict[str, _EnvDefaults],
+]
 
 
 class BaseCLIApp:
@@ -38,17 +100,61 @@ class BaseCLIApp:
     - Add custom commands to the parser.
     """
 
+    # Built parsers, shared by instances with the same app class, config and
+    # registry version. Only the current registry version is kept.
+    _parser_cache: ClassVar[Dict[tuple, _ParserBundle]] = {}
+
     def __init__(self, config: CLIConfig):
         """
-        :param gui_callback: The callback function to run the GUI application.
-        :type gui_callback: Optional[callable]
+        :param config: The configuration for the CLI application.
+        :type config: CLIConfig
         """
 
+        # Nothing is built here: the parser is created (or fetched from the
+        # cache) on first use, so constructing the app stays cheap.
         self.config = config
 
-        self.parser = self._create_main_parser()
-        self.subparsers = self._add_subparsers(self.parser)
-        self._add_custom_commands(self.subparsers)
+    @cached_property
+    def _parser_bundle(self) -> _ParserBundle:
+        version = CommandRegistry.version()
+        key = (type(self), self.config, version)
+        cache = self._parser_cache
+        cached = cache.get(key)
+        if cached is None:
+            # Parsers built for an older registry can never be hit again.
+            for stale in [k for k in cache if k[2] != version]:
+                del cache[stale]
+            parser = self._create_main_parser()
+            subparsers = self._add_subparsers(parser)
+            # Registry commands are attached on demand by parse_args, so only
+            # the selected command pays for building its subparser.
+            cached = (parser, subparsers, {})
+            self._add_builtin_commands(subparsers)
+            cache[key] = cached
+        return cached
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """The main parser for the CLI application."""
+        return self._parser_bundle[0]
+
+    @property
+    def subparsers(self) -> argparse._SubParsersAction:
+        """The subparsers action of the main parser."""
+        return self._parser_bundle[1]
+
+    @property
+    def _attached_commands(self) -> Dict[str, _EnvDefaults]:
+        return self._parser_bundle[2]
+
+    def _add_builtin_commands(self, subparsers: argparse._SubParsersAction):
+        """
+        Add commands handled by the application itself rather than the
+        registry. Called once per cached parser.
+
+        :param subparsers: The subparsers for the main parser.
+        :type subparsers: argparse._SubParsersAction
+        """
 
     def _create_main_parser(self) -> argparse.ArgumentParser:
         """
@@ -94,65 +200,100 @@ class BaseCLIApp:
         """
         Add custom commands to the parser.
 
+        Only the subparsers are created (name, help, aliases), which is all
+        the top-level help and choice errors need; arguments are defined by
+        :meth:`_add_custom_command` for the command actually selected.
+
         :param subparsers: The subparsers for the main parser.
         :type subparsers: argparse._SubParsersAction
         """
-        for command_name in CommandRegistry.names():
-            command_cls = CommandRegistry.get(command_name)
-            doc = (command_cls.__doc__ or "").strip()
-            summary = command_cls.summary or (
-                doc.splitlines()[0] if doc else None
+        metadata = _command_metadata(CommandRegistry.version())
+        for command_name in metadata:
+            self._add_custom_command(
+                subparsers, command_name, with_arguments=False
             )
+
+    def _add_custom_command(
+        self,
+        subparsers: argparse._SubParsersAction,
+        command_name: str,
+        with_arguments: bool = True,
+    ):
+        """
+        Add a single registry command to the parser, once.
+
+        :param subparsers: The subparsers for the main parser.
+        :type subparsers: argparse._SubParsersAction
+
+        :param command_name: The primary name of the command.
+        :type command_name: str
+
+        :param with_arguments: Whether to also define the command arguments.
+        :type with_arguments: bool
+        """
+        command_cls, summary, description, aliases = _command_metadata(
+            CommandRegistry.version()
+        )[command_name]
+        command_parser = subparsers.choices.get(command_cls.name)
+        if command_parser is None:
             command_parser = subparsers.add_parser(
                 command_cls.name,
                 help=summary,
-                description=doc or summary,
+                description=description,
                 epilog=command_cls.epilog,
-                aliases=getattr(command_cls, "aliases", ()),
-                formatter_class=argparse.RawDescriptionHelpFormatter,
+                aliases=aliases,
+                formatter_class=_FMT,
+            )
+            # Resolved here once so run_command needs no registry lookup.
+            command_parser.set_defaults(_command_cls=command_cls)
+        if with_arguments and command_name not in self._attached_commands:
+            self._attached_commands[command_name] = (
+                self.define_command_arguments(command_parser, command_cls)
             )
-            self.define_command_arguments(command_parser, command_cls)
 
     def define_command_arguments(
         self, command_parser: argparse.ArgumentParser, command_cls: BaseCommand
-    ):
+    ) -> _EnvDefaults:
         """
         Define arguments for a command.
 
+        Defaults taken from the environment are not baked into the parser,
+        which is cached and shared: parse_args reads them on every parse.
+
         :param command_parser: The parser for the command.
         :type command_parser: argparse.ArgumentParser
 
         :param command_cls: The class for the command.
         :type command_cls: BaseCommand
+
+        :return: The (dest, environment variable) of env-backed arguments.
+        :rtype: _EnvDefaults
+        """
+        env_defaults = []
+        for flag, kwargs, env in command_cls.compiled_arguments():
+            action = command_parser.add_argument(flag, **kwargs)
+            if env is not None:
+                env_defaults.append((action.dest, env))
+        return tuple(env_defaults)
+
+    def _apply_env_defaults(self, command_name: str):
         """
-        for arg in command_cls.define_arguments():
-            if arg.data_type is bool and arg.required:
-                raise ValueError(
-                    f"Boolean flag --{arg.name} cannot be required"
-                )
-            default = arg.default
-            if arg.env and default is None:
-                default = os.getenv(arg.env)
-
-            kwargs = {
-                "help": arg.help_text,
-                "required": arg.required,
-                "default": default,
-            }
-            if arg.choices:
-                kwargs["choices"] = arg.choices
-            if arg.nargs is not None:
-                kwargs["nargs"] = arg.nargs
-            if arg.metavar:
-                kwargs["metavar"] = arg.metavar
-
-            ty = coerce_type(arg.data_type)
-            if ty is bool:
-                kwargs["action"] = "store_true"
-            else:
-                kwargs["type"] = ty
-
-            command_parser.add_argument(f"--{arg.name}", **kwargs)
+        Set the env-backed defaults of an attached command from the current
+        environment.
+
+        :param command_name: The primary name of the command.
+        :type command_name: str
+        """
+        env_defaults = self._attached_commands.get(command_name)
+        if not env_defaults:
+            return
+        command_cls = _command_metadata(CommandRegistry.version())[
+            command_name
+        ][0]
+        environ = os.environ
+        self.subparsers.choices[command_cls.name].set_defaults(
+            **{dest: environ.get(env) for dest, env in env_defaults}
+        )
 
     def parse_args(
         self, argv: Optional[List[str]] = None
@@ -160,9 +301,28 @@ class BaseCLIApp:
         """
         Parse the command line arguments and return the parser and the parsed arguments.
 
+        Only the selected command gets its arguments defined. When no
+        registry command is selected (e.g. bare ``--help``), every command is
+        listed so usage and errors show them all.
+
         :return: The parser and the parsed arguments.
         :rtype: Tuple[argparse.ArgumentParser, argparse.Namespace]
         """
+        if argv is None:
+            argv = sys.argv[1:]
+        # The main parser only has flag options, so the first positional
+        # token is the command name.
+        token = next((a for a in argv if not a.startswith("-")), None)
+        # Justification: alias resolution is the registry's own lookup; there
+        # is no public accessor for the primary name.
+        # pylint: disable=protected-access
+        primary = CommandRegistry._resolve_primary(token) if token else None
+        # pylint: enable=protected-access
+        if primary in _command_metadata(CommandRegistry.version()):
+            self._add_custom_command(self.subparsers, primary)
+            self._apply_env_defaults(primary)
+        elif token not in self.subparsers.choices:
+            self._add_custom_commands(self.subparsers)
         return self.parser.parse_args(argv)
 
     def run(self, argv: Optional[List[str]] = None) -> int:
@@ -175,6 +335,21 @@ class BaseCLIApp:
         :return: The exit code of the application.
         :rtype: int
         """
+        if argv is None:
+            argv = sys.argv[1:]
+        first = argv[0] if argv else None
+        if first == "--version" and self.config.version:
+            # Same output as argparse's version action, without any parsing.
+            version = self.config.version
+            if "%(prog)" in version:
+                version = version % {"prog": self.parser.prog}
+            print(version)
+            return 0
+        if first is None or first in _HELP_FLAGS:
+            # Nothing to parse or dispatch: only the command listing is needed.
+            self._add_custom_commands(self.subparsers)
+            self.parser.print_help()
+            return 0 if first else 1
         args = self.parse_args(argv)
         return self.run_command(args) or 0
 
@@ -188,18 +363,22 @@ class BaseCLIApp:
         :param run_callback: The callback function to run the command.
         :type run_callback: callable
         """
-        if not getattr(args, "command", None):
+        # Always present: the subparsers action uses dest="command".
+        if not args.command:
             self.parser.print_help()
             return 1
 
-        command_cls = CommandRegistry.get(args.command)
+        command_cls = getattr(
+            args, "_command_cls", None
+        ) or CommandRegistry.try_get(args.command)
         if not command_cls:
             self.parser.print_help()
             return 1
 
         command_instance: BaseCommand = command_cls()
-        cmd_args = vars(args).copy()
-        cmd_args.pop("command", None)
+        cmd_args = {
+            k: v for k, v in vars(args).items() if k not in _DISPATCH_KEYS
+        }
         try:
             command_instance.validate(**cmd_args)
             return command_instance.execute(**cmd_args) or 0
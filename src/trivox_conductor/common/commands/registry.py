@@ -1,6 +1,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Optional, Type, Mapping, MutableMapping, ClassVar, TYPE_CHECKING
 
 from trivox_conductor.common.registry import EndpointRegistry
@@ -18,11 +19,28 @@ class CommandRegistry(EndpointRegistry["BaseCommand"]):
     # set by BaseCommand after class is defined to avoid import cycles
     endpoint_base: ClassVar[type]  # = BaseCommand  (assigned in base_command.py)
 
-    _alias_map: ClassVar[MutableMapping[str, str]]  # alias -> primary name
+    # alias -> primary name; subclasses get their own map in __init_subclass__
+    _alias_map: ClassVar[MutableMapping[str, str]] = {}
+
+    # (registry version, snapshot); rebuilt once the version moves on
+    _names_cache: ClassVar[Optional[tuple[int, list[str]]]] = None
+    # (registry version, primary names and aliases -> class, read-only view);
+    # one dict for single-probe lookups
+    _flat: ClassVar[
+        Optional[
+            tuple[
+                int,
+                dict[str, Type["BaseCommand"]],
+                Mapping[str, Type["BaseCommand"]],
+            ]
+        ]
+    ] = None
 
     def __init_subclass__(cls, **kwargs):  # type: ignore[override]
         super().__init_subclass__(**kwargs)
         cls._alias_map = {}
+        cls._names_cache = None
+        cls._flat = None
 
     # --- overrides / helpers -------------------------------------------------
 
@@ -46,6 +64,14 @@ class CommandRegistry(EndpointRegistry["BaseCommand"]):
         # Delegate core checks and primary registration
         super().register(name, impl_class, replace=replace)
 
+        # Help metadata never changes after class creation: derive it once.
+        doc = (impl_class.__doc__ or "").strip()
+        impl_class._cached_doc = doc
+        impl_class._cached_summary = impl_class.summary or (
+            doc.splitlines()[0] if doc else None
+        )
+        impl_class._cached_aliases = tuple(aliases)
+
         # Record aliases -> primary name
         with cls._lock:
             for a in aliases:
@@ -53,6 +79,8 @@ class CommandRegistry(EndpointRegistry["BaseCommand"]):
                 if not replace and a in cls._alias_map and cls._alias_map[a] != name:
                     raise KeyError(f"Alias '{a}' already mapped to '{cls._alias_map[a]}'")
                 cls._alias_map[a] = name
+            if aliases:
+                cls._version += 1
 
     @classmethod
     def endpoint(
@@ -88,39 +116,60 @@ class CommandRegistry(EndpointRegistry["BaseCommand"]):
     # Lookups that understand aliases
     @classmethod
     def _resolve_primary(cls, name_or_alias: str) -> str:
+        # Two dict probes; hot lookups go through _flat_map() instead.
         if name_or_alias in cls._registry:
             return name_or_alias
         return cls._alias_map.get(name_or_alias, name_or_alias)
 
+    @classmethod
+    def _flat_map(cls) -> dict[str, Type["BaseCommand"]]:
+        """Primary names plus aliases, rebuilt once per registry version."""
+        cached = cls._flat
+        if cached is None or cached[0] != cls._version:
+            flat: dict[str, Type["BaseCommand"]] = {
+                alias: cls._registry[primary]
+                for alias, primary in cls._alias_map.items()
+                if primary in cls._registry
+            }
+            flat.update(cls._registry)  # primary names win over aliases
+            cached = cls._flat = (cls._version, flat, MappingProxyType(flat))
+        return cached[1]
+
     @classmethod
     def get(cls, name_or_alias: str) -> Type["BaseCommand"]:
-        primary = cls._resolve_primary(name_or_alias)
-        return super().get(primary)
+        impl = cls._flat_map().get(name_or_alias)
+        if impl is None:
+            raise KeyError(f"Unknown endpoint '{name_or_alias}'")
+        return impl
 
     @classmethod
     def try_get(cls, name_or_alias: str) -> Optional[Type["BaseCommand"]]:
-        primary = cls._resolve_primary(name_or_alias)
-        return super().try_get(primary)
+        return cls._flat_map().get(name_or_alias)
 
     @classmethod
     def contains(cls, name_or_alias: str) -> bool:
-        primary = cls._resolve_primary(name_or_alias)
-        return super().contains(primary)
+        return name_or_alias in cls._flat_map()
 
     @classmethod
     def names(cls) -> list[str]:
-        """Primary command names only (aliases excluded)."""
-        return super().names()
+        """
+        Primary command names only (aliases excluded).
+        Cached until the registry changes; treat the list as read-only.
+        """
+        cached = cls._names_cache
+        if cached is None or cached[0] != cls._version:
+            cached = cls._names_cache = (cls._version, super().names())
+        return cached[1]
 
     @classmethod
     def all_with_aliases(cls) -> Mapping[str, Type["BaseCommand"]]:
-        """Convenience: primary names plus alias keys."""
-        # snapshot with aliases pointing to same class
-        out: dict[str, Type["BaseCommand"]]= dict(cls._registry)
-        for alias, primary in cls._alias_map.items():
-            if primary in cls._registry:
-                out[alias] = cls._registry[primary]
-        return out
+        """
+        Convenience: primary names plus alias keys.
+        Returns the cached flat map behind a read-only view, so no copy is
+        made per call; the view is replaced once the registry changes.
+        """
+        cls._flat_map()
+        return cls._flat[2]
 
     @classmethod
     def unregister(cls, name_or_alias: str) -> None:
@@ -133,9 +182,12 @@ class CommandRegistry(EndpointRegistry["BaseCommand"]):
             to_del = [a for a, p in cls._alias_map.items() if p == primary]
             for a in to_del:
                 cls._alias_map.pop(a, None)
+            cls._version += 1
 
     @classmethod
     def clear(cls) -> None:
+        # _lock is not reentrant: the base clear takes it on its own
+        super().clear()
         with cls._lock:
-            super().clear()
-            cls._alias_map.clear()
+            cls._alias_map = {}
+            cls._version += 1
@@ -0,0 +1,66 @@
+"""
+Class-aware logger adapter.
+This module provides a LoggerAdapter that stamps records with the name of
+the emitting class, so the EnsureClassName filter does not have to look it
+up from the stack.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, MutableMapping, Tuple, Union
+
+
+class ClassNameAdapter(logging.LoggerAdapter):
+    """
+    Logger adapter that injects a fixed ``classname`` into every record.
+    """
+
+    def process(
+        self, msg: Any, kwargs: MutableMapping[str, Any]
+    ) -> Tuple[Any, MutableMapping[str, Any]]:
+        """
+        Add the adapter's classname to the record extras.
+
+        An explicit ``extra={"classname": ...}`` from the call site wins.
+
+        :param msg: The log message.
+        :type msg: Any
+
+        :param kwargs: The keyword arguments of the logging call.
+        :type kwargs: MutableMapping[str, Any]
+
+        :return: The message and the updated keyword arguments.
+        :rtype: Tuple[Any, MutableMapping[str, Any]]
+        """
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
+
+@lru_cache(maxsize=None)
+def _adapter_for(cls: type, name: str) -> ClassNameAdapter:
+    return ClassNameAdapter(
+        logging.getLogger(name), {"classname": cls.__name__}
+    )
+
+
+def get_class_logger(
+    obj_or_cls: Union[object, type], name: str = "trivox_conductor"
+) -> ClassNameAdapter:
+    """
+    Get a logger that tags records with the class of `obj_or_cls`.
+
+    Adapters are cached per (class, logger name), so this is cheap to call
+    from ``__init__`` or at class definition time.
+
+    :param obj_or_cls: An instance or a class.
+    :type obj_or_cls: Union[object, type]
+
+    :param name: The name of the underlying logger.
+    :type name: str
+
+    :return: The cached adapter.
+    :rtype: ClassNameAdapter
+    """
+    cls = obj_or_cls if isinstance(obj_or_cls, type) else type(obj_or_cls)
+    return _adapter_for(cls, name)
@@ -1,10 +1,35 @@
 """
 Logger filter to ensure that 'classname' attribute is set in log records.
+
+The classname is passed by the caller, through
+:func:`trivox_conductor.common.logging.class_logger.get_class_logger` or
+``extra={"classname": ...}``; records without one get "-".
+
+Legacy callers that log through a plain logger can opt into recovering the
+class from the stack by setting :data:`FRAME_WALK`: a short, bounded walk
+up the emitting thread's stack per record. It stays off by default since
+it costs a frame walk per record, and on PyPy ``sys._getframe`` forces the
+JIT to materialize frames and de-optimizes the calling code.
 """
 
 import logging
+import os
 import sys
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# Opt-in: set to True to recover the classname of records logged without
+# one by walking the stack (see the module docstring).
+FRAME_WALK = False
+
+# The walk starts at the frame that called Filterer.filter (Handler.handle);
+# the emitting frame sits a few logging-internal frames above it, which are
+# skipped without comparing (same idea as absl's logging-frame skipping).
+_FIRST_FRAME = 2
+_MAX_FRAME_HOPS = 24
+_LOGGING_PREFIX = os.path.dirname(logging.__file__) + os.sep
+
+# Upper bound on remembered call sites that have no class context.
+_NO_CLASS_CACHE_SIZE = 4096
 
 
 def _classname_from_locals(locals_) -> Optional[str]:
@@ -19,31 +44,75 @@ def _classname_from_locals(locals_) -> Optional[str]:
 
 class EnsureClassName(logging.Filter):
     """
-    Populate record.classname by finding the *emitting* frame:
-    we match by (pathname, funcName) and read self/cls from its locals.
-    Falls back to "-" when not in a class context (module funcs/staticmethods).
+    Populate record.classname, preferring a value provided by the caller.
+
+    Otherwise "-", unless FRAME_WALK is set: then find the *emitting*
+    frame: we match by (pathname, funcName)
+    and read self/cls from its locals. Falls back to "-" when not in a class
+    context (module funcs/staticmethods).
+
+    Call sites found to have no class context are remembered, so later
+    records from them skip the walk. Sites inside methods are walked every
+    time: an inherited method logs under the class of the instance.
     """
 
+    def __init__(self, name: str = ""):
+        """
+        :param name: The logger name to filter on (see logging.Filter).
+        :type name: str
+        """
+        super().__init__(name)
+        # (pathname, lineno, funcName) of call sites outside any class
+        self._no_class: Dict[Tuple[str, int, str], None] = {}
+
     def filter(self, record: logging.LogRecord) -> bool:
         # keep any explicitly-provided classname
         if getattr(record, "classname", None):
             return True
+        if not FRAME_WALK:
+            record.classname = "-"
+            return True
+
+        site = (record.pathname, record.lineno, record.funcName)
+        if site in self._no_class:
+            record.classname = "-"
+            return True
 
+        found, clsname = self._walk(record)
+        if found and clsname is None:
+            cache = self._no_class
+            if len(cache) >= _NO_CLASS_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order).
+                cache.pop(next(iter(cache), None), None)
+            cache[site] = None
+        record.classname = clsname or "-"
+        return True
+
+    @staticmethod
+    def _walk(record: logging.LogRecord) -> Tuple[bool, Optional[str]]:
         target_path = record.pathname  # absolute path to the file
         target_func = record.funcName  # function name that logged
 
-        # Walk current stack; stop when we match the record’s file+func.
-        f = sys._getframe()
-        for _ in range(200):  # safety cap
+        # Walk the current stack; stop when we match the record's file+func.
+        # Justification: frame access is the only way to recover the caller's
+        # self/cls once the record has been created.
+        # pylint: disable=protected-access
+        try:
+            f = sys._getframe(_FIRST_FRAME)
+        except ValueError:
+            return False, None
+        # pylint: enable=protected-access
+        for _ in range(_MAX_FRAME_HOPS):
             if f is None:
                 break
             code = f.f_code
-            if code.co_filename == target_path and code.co_name == target_func:
-                clsname = _classname_from_locals(f.f_locals)
-                record.classname = clsname or "-"
-                return True
+            filename = code.co_filename
+            if filename.startswith(_LOGGING_PREFIX):
+                f = f.f_back
+                continue
+            if filename == target_path and code.co_name == target_func:
+                return True, _classname_from_locals(f.f_locals)
             f = f.f_back
 
-        # Fallback: we didn’t find the exact frame (wrappers, C calls, etc.)
-        record.classname = "-"
-        return True
+        # Not found (wrappers, C calls, records from another thread, etc.)
+        return False, None
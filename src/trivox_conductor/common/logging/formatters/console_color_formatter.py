@@ -22,6 +22,14 @@ class ConsoleColorFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset color
     }
 
+    # levelno -> (prefix, suffix), built once; unknown levels get RESET only.
+    _WRAP = {
+        level: (code, "\033[0m")
+        for level, code in COLORS.items()
+        if isinstance(level, int)
+    }
+    _DEFAULT_WRAP = (COLORS["RESET"], COLORS["RESET"])
+
     def __init__(self, fmt=None, datefmt=None, style="%"):
         """
         :param fmt: The format string for the log message.
@@ -49,10 +57,5 @@ class ConsoleColorFormatter(logging.Formatter):
         :rtype: str
         """
 
-        color = ConsoleColorFormatter.COLORS.get(
-            record.levelno, ConsoleColorFormatter.COLORS["RESET"]
-        )
-        formatted_record = super().format(record)
-        return (
-            f"{color}{formatted_record}{ConsoleColorFormatter.COLORS['RESET']}"
-        )
+        prefix, suffix = self._WRAP.get(record.levelno, self._DEFAULT_WRAP)
+        return f"{prefix}{logging.Formatter.format(self, record)}{suffix}"
@@ -31,6 +31,20 @@ class HTMLFormatter(logging.Formatter):
         super().__init__()
         self.fmt_keys = fmt_keys if fmt_keys is not None else {}
 
+        # One formatter per colored level, built once. format() picks one
+        # instead of swapping self._style._fmt, which raced between threads
+        # sharing this formatter.
+        font = self.fmt_keys.get("font")
+        fmt = self.fmt_keys.get("format")
+        self._level_formatters: dict[int, logging.Formatter] = (
+            {
+                level: logging.Formatter(font.format(color, fmt))
+                for level, color in HTMLFormatter.COLORS.items()
+            }
+            if font is not None
+            else {}
+        )
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format the specified log record as HTML.
@@ -44,14 +58,7 @@ class HTMLFormatter(logging.Formatter):
         :return: The formatted log message as an HTML string.
         :rtype: str
         """
-        last_fmt = self._style._fmt
-
-        color = HTMLFormatter.COLORS.get(record.levelno)
-        if color:
-            font = self.fmt_keys.get("font")
-            fmt = self.fmt_keys.get("format")
-            self._style._fmt = font.format(color, fmt)
-
-        res = logging.Formatter.format(self, record)
-        self._style._fmt = last_fmt
-        return res
+        formatter = self._level_formatters.get(record.levelno)
+        if formatter is None:
+            return logging.Formatter.format(self, record)
+        return formatter.format(record)
@@ -1,7 +1,17 @@
 """
 Handlers for the ICTools logger.
+
+Each handler checks whether its sink can take the record before doing any
+formatting: ConsoleStreamHandler and QtLogger return early when nobody is
+subscribed, SocketLogger while the server is marked down, and
+RobustSocketLogger defers pickling to its sender thread.
+
+Callers should keep their own side cheap as well: pass arguments lazily
+(``logger.debug("x=%s", x)``, never an f-string) and guard arguments that
+are expensive to compute with ``if logger.isEnabledFor(logging.DEBUG):``.
 """
 
+from .buffered_file import BufferedFallbackHandler
 from .console_stream import ConsoleStreamHandler
 from .qtext_edit_logger import QtLogger
 from .socket_handler import (
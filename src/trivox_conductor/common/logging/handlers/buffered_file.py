@@ -0,0 +1,147 @@
+"""
+Buffered file handler for logging.
+Aggregates many small record writes into fewer, larger disk writes.
+"""
+
+import logging
+import os
+import threading
+from typing import BinaryIO, Optional
+
+
+# Justification: many arguments are needed for configuration
+# pylint: disable=too-many-arguments
+class BufferedFallbackHandler(logging.Handler):
+    """
+    Append-only, size-rotated file handler with a write buffer.
+    - Records go through an io.BufferedWriter instead of one write per record
+    - The buffer is flushed at most `flush_interval` seconds after a write
+    - The file is opened on the first record
+    - Rotates like RotatingFileHandler (name.1 ... name.N) past `max_bytes`
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        buffer_size: int = 65536,
+        flush_interval: float = 0.5,
+        max_bytes: int = 5_000_000,
+        backup_count: int = 3,
+        encoding: str = "utf-8",
+    ):
+        """
+        :param filename: Path of the log file.
+        :type filename: str
+
+        :param buffer_size: Size in bytes of the write buffer.
+        :type buffer_size: int
+
+        :param flush_interval: Longest time in seconds a record stays buffered.
+        :type flush_interval: float
+
+        :param max_bytes: Size at which the file is rotated; 0 disables it.
+        :type max_bytes: int
+
+        :param backup_count: Number of rotated files to keep; 0 disables
+            rotation.
+        :type backup_count: int
+
+        :param encoding: Encoding of the written text.
+        :type encoding: str
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._encoding = encoding
+
+        self._stream: Optional[BinaryIO] = None
+        self._size = 0
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def emit(self, record: logging.LogRecord):
+        """
+        Buffer a formatted record, scheduling a flush if none is pending.
+
+        :param record: The log record to write.
+        :type record: logging.LogRecord
+        """
+        try:
+            data = (self.format(record) + "\n").encode(self._encoding)
+            with self.lock:
+                if self._stream is None:
+                    self._open()
+                if self._should_rotate(len(data)):
+                    self._rotate()
+                self._stream.write(data)
+                self._size += len(data)
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        self._flush_interval, self.flush
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+        # Justification: Broad except is required to avoid crashes in logging
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            self.handleError(record)
+        # pylint: enable=broad-exception-caught
+
+    def flush(self):
+        """
+        Write the buffered records to disk.
+        """
+        with self.lock:
+            self._flush_timer = None
+            if self._stream is not None:
+                self._stream.flush()
+
+    def close(self):
+        """
+        Flush and close the file.
+        """
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._stream is not None:
+                try:
+                    self._stream.flush()
+                finally:
+                    self._stream.close()
+                    self._stream = None
+        super().close()
+
+    def _open(self):
+        # "ab" with an explicit buffering size yields an io.BufferedWriter
+        # Justification: the stream outlives this call; close() closes it
+        # pylint: disable=consider-using-with
+        self._stream = open(
+            self.baseFilename, "ab", buffering=self._buffer_size
+        )
+        # pylint: enable=consider-using-with
+        self._size = os.fstat(self._stream.fileno()).st_size
+
+    def _should_rotate(self, incoming: int) -> bool:
+        return (
+            self._max_bytes > 0
+            and self._backup_count > 0
+            and self._size > 0
+            and self._size + incoming > self._max_bytes
+        )
+
+    def _rotate(self):
+        self._stream.close()
+        self._stream = None
+        for i in range(self._backup_count - 1, 0, -1):
+            src = f"{self.baseFilename}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.baseFilename}.{i + 1}")
+        os.replace(self.baseFilename, f"{self.baseFilename}.1")
+        self._open()
+
+
+# pylint: enable=too-many-arguments
@@ -11,7 +11,13 @@ from trivox_conductor.common.logging.log_subscriber import log_subscriber
 class ConsoleStreamHandler(logging.Handler):
     """Send formatted log lines to LogSubscriber (not stdout redirection)."""
 
+    # LogSubscriber channel this handler publishes on
+    channel = "console"
+
     def emit(self, record: logging.LogRecord):
+        # Nobody listening: skip formatting altogether.
+        if not log_subscriber.has_listeners(self.channel):
+            return
         try:
             line = self.format(record)
             # Justification: Broad except is required to avoid crashes in logging
@@ -20,4 +26,4 @@ class ConsoleStreamHandler(logging.Handler):
             self.handleError(record)
             return
         # pylint: enable=broad-exception-caught
-        log_subscriber.notify(line)
+        log_subscriber.notify(line, self.channel)
@@ -89,6 +89,9 @@ class QtLogger(logging.Handler):
     log messages to be displayed in a QTextEdit widget.
     """
 
+    # LogSubscriber channel this handler publishes on
+    channel = "qt"
+
     def __init__(self):
         super().__init__()
 
@@ -99,5 +102,8 @@ class QtLogger(logging.Handler):
         :param record: The log record to emit.
         :type record: logging.LogRecord
         """
+        # Nobody listening: skip formatting altogether.
+        if not log_subscriber.has_listeners(self.channel):
+            return
         log_entry = self.format(record)
-        log_subscriber.notify(log_entry)
+        log_subscriber.notify(log_entry, self.channel)
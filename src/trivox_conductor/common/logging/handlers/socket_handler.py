@@ -5,16 +5,70 @@ Socket handler for logging.
 # Justification: broad exception handling is needed to avoid logging failures
 # pylint: disable=broad-exception-caught
 
+import copy
 import logging
 import pickle
-import queue
 import random
 import socket
 import struct
 import threading
 import time
-from logging.handlers import RotatingFileHandler, SocketHandler
-from typing import Optional
+from collections import deque
+from logging.handlers import SocketHandler
+from typing import Deque, List, Optional
+
+from .buffered_file import BufferedFallbackHandler
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # the msgpack wire format is optional
+    msgpack = None  # type: ignore
+
+# Big-endian length header; compiled once instead of per record.
+_LEN_HEADER = struct.Struct(">L")
+_PACK_LEN = _LEN_HEADER.pack
+_PACK_LEN_INTO = _LEN_HEADER.pack_into
+
+# Most records the sender thread ships in a single write.
+_SEND_BATCH = 64
+
+# On-wire encodings of a record, each framed by a 4-byte big-endian length:
+# - "pickle": the pickled record, as logging.handlers.SocketHandler sends it
+# - "msgpack": a msgpack map with keys l (levelno), n (logger name),
+#   m (message), t (created), p (pathname), f (funcName), ln (lineno) and
+#   c (classname, or None)
+WIRE_FORMATS = ("pickle", "msgpack")
+
+
+def _check_wire_format(wire_format: str) -> str:
+    if wire_format not in WIRE_FORMATS:
+        raise ValueError(
+            f"Unknown wire format {wire_format!r}, expected one of "
+            f"{', '.join(WIRE_FORMATS)}"
+        )
+    if wire_format == "msgpack" and msgpack is None:
+        raise ValueError("The msgpack wire format requires 'msgpack'")
+    return wire_format
+
+
+def _msgpack_payload(record: logging.LogRecord) -> bytes:
+    return msgpack.packb(
+        {
+            "l": record.levelno,
+            "n": record.name,
+            "m": record.getMessage(),
+            "t": record.created,
+            "p": record.pathname,
+            "f": record.funcName,
+            "ln": record.lineno,
+            "c": getattr(record, "classname", None),
+        }
+    )
+
+
+def _msgpack_frame(record: logging.LogRecord) -> bytes:
+    payload = _msgpack_payload(record)
+    return _PACK_LEN(len(payload)) + payload
 
 
 class SocketLogger(SocketHandler):
@@ -23,10 +77,27 @@ class SocketLogger(SocketHandler):
     It sends log records over a socket connection with custom formatting and handling.
     """
 
-    _server_available = None
-    _last_check_time = 0
+    # Optimistic: the first record connects through SocketHandler.send. After
+    # a failure, records are dropped for _check_interval seconds before the
+    # next attempt, so emit never probes the server on the caller's thread.
+    _server_available = True
+    _last_check_time = 0.0
     _check_interval = 10
 
+    def __init__(self, host: str, port: int, *, wire_format: str = "pickle"):
+        """
+        :param host: The host of the log server.
+        :type host: str
+
+        :param port: The port of the log server.
+        :type port: int
+
+        :param wire_format: Record encoding, one of WIRE_FORMATS.
+        :type wire_format: str
+        """
+        super().__init__(host, port)
+        self._wire_format = _check_wire_format(wire_format)
+
     @staticmethod
     def is_server_available(host, port):
         """
@@ -39,18 +110,17 @@ class SocketLogger(SocketHandler):
             return False
 
     def emit(self, record):
-        current_time = time.time()
-
-        if self._server_available is None:
-            self._server_available = self.is_server_available(
-                self.host, self.port
-            )
-            self._last_check_time = current_time
-
         if not self._server_available:
-            return  # Skip logging if the server is unavailable
+            if time.monotonic() - self._last_check_time < self._check_interval:
+                return  # Skip logging while the server is unavailable
+            self._server_available = True  # retry with this record
 
         try:
+            if self._wire_format == "msgpack":
+                # Plain fields only: nothing to stringify or pickle
+                self.send(_msgpack_frame(record))
+                return
+
             # if record is not serializable, it will raise an exception
             # so turn it into a string
             # TODO: Santi - Improve this to handle non-serializable objects
@@ -58,12 +128,10 @@ class SocketLogger(SocketHandler):
                 record.msg = str(record.msg)
 
             # Pickle the record
-            s = pickle.dumps(record)
+            s = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
 
             # Prepend the length of the pickled data
-            slen = struct.pack(">L", len(s))
-
-            self.send(slen + s)
+            self.send(_PACK_LEN(len(s)) + s)
         except (
             pickle.PicklingError,
             TypeError,
@@ -75,12 +143,16 @@ class SocketLogger(SocketHandler):
 
     def send(self, s):
         """
-        Send the s (data) to the socket. Reset server availability on errors.
+        Send the s (data) to the socket. Mark the server down on errors.
         """
         try:
             super().send(s)
         except (socket.error, BrokenPipeError):
-            self._server_available = None  # Reset availability flag
+            self.sock = None
+        # SocketHandler.send swallows connect/send errors and drops the socket
+        if self.sock is None:
+            self._server_available = False
+            self._last_check_time = time.monotonic()
 
 
 # Justification: many arguments are needed for configuration
@@ -90,8 +162,8 @@ class RobustSocketLogger(SocketHandler):
     Non-blocking, auto-reconnecting SocketHandler with an in-memory ring buffer.
     - Enqueues records immediately (fast path)
     - Background thread handles (re)connect and flush
-    - Bounded queue with drop-oldest policy
-    - Optional local fallback file when queue overflows
+    - Bounded deque with drop-oldest policy
+    - Optional local fallback file for records evicted on overflow
     """
 
     def __init__(
@@ -103,15 +175,29 @@ class RobustSocketLogger(SocketHandler):
         fallback_file: Optional[str] = None,
         backoff_min: float = 0.25,
         backoff_max: float = 8.0,
+        wire_format: str = "pickle",
     ):
         # Do not connect in base __init__; we manage the socket ourselves
         super().__init__(host, port)
         # Ensure base class doesn't try to connect eagerly
         self.sock = None
 
-        self._q: "queue.Queue[logging.LogRecord]" = queue.Queue(
-            maxsize=queue_maxsize
+        # Record -> unframed payload, used by the sender thread
+        self._encode = (
+            _msgpack_payload
+            if _check_wire_format(wire_format) == "msgpack"
+            else self._pickle_payload
+        )
+        # Frames of the batch being sent. Only the sender thread touches it,
+        # and it keeps its size between batches, so framing reuses memory.
+        self._buf = bytearray()
+
+        # Ring buffer: appending to a full deque evicts the oldest record.
+        # A non-positive size means unbounded, as with queue.Queue.
+        self._dq: Deque[logging.LogRecord] = deque(
+            maxlen=queue_maxsize if queue_maxsize > 0 else None
         )
+        self._cv = threading.Condition()
         self._stop = threading.Event()
         self._sender = threading.Thread(
             target=self._run_sender, name="LogSocketSender", daemon=True
@@ -120,14 +206,14 @@ class RobustSocketLogger(SocketHandler):
         self._backoff_min = backoff_min
         self._backoff_max = backoff_max
 
-        self._fallback: Optional[RotatingFileHandler] = None
+        self._fallback: Optional[BufferedFallbackHandler] = None
         if fallback_file:
-            self._fallback = RotatingFileHandler(
+            # Buffered: the fallback is busiest during outage bursts
+            self._fallback = BufferedFallbackHandler(
                 fallback_file,
-                maxBytes=5_000_000,
-                backupCount=3,
+                max_bytes=5_000_000,
+                backup_count=3,
                 encoding="utf-8",
-                delay=True,
             )
             # simple, robust formatter; avoid fields that may be missing on foreign records
             fmt = logging.Formatter(
@@ -144,23 +230,21 @@ class RobustSocketLogger(SocketHandler):
         Enqueue and return. Never block the app's logging call.
         """
         try:
-            # Wrap payload with length prefix now, keep sender simple.
-            framed = self.makePickle(record)
-            try:
-                self._q.put_nowait((record, framed))
-            except queue.Full:
-                # Drop oldest (ring buffer policy)
-                try:
-                    self._q.get_nowait()
-                except queue.Empty:
-                    pass
-                # Try again; if still full, fallback to file
-                try:
-                    self._q.put_nowait((record, framed))
-                except queue.Full:
-                    if self._fallback:
-                        self._fallback.emit(record)
-                    # else drop silently
+            # Pickling happens on the sender thread. Only the message is
+            # rendered here, on a copy, so later changes to the args cannot
+            # alter what is sent.
+            frozen = copy.copy(record)
+            frozen.msg = record.getMessage()
+            frozen.args = None
+            evicted = None
+            with self._cv:
+                dq = self._dq
+                if len(dq) == dq.maxlen:
+                    evicted = dq[0]  # dropped by the append (ring buffer)
+                dq.append(frozen)
+                self._cv.notify()
+            if evicted is not None and self._fallback:
+                self._fallback.emit(evicted)
         except Exception:
             # Never raise from logging; record to fallback if available
             if self._fallback:
@@ -172,6 +256,8 @@ class RobustSocketLogger(SocketHandler):
     def close(self):
         try:
             self._stop.set()
+            with self._cv:
+                self._cv.notify()
             self._sender.join(timeout=2.0)
         finally:
             try:
@@ -201,35 +287,93 @@ class RobustSocketLogger(SocketHandler):
                     backoff = self._backoff_min  # reset on success
 
                 # If connected, block briefly waiting for data to send
-                record, framed = self._q.get(timeout=0.5)
+                batch = self._take_batch(0.5)
+                if not batch:
+                    # No data; loop again (and reconnect if needed)
+                    if self.sock is None:
+                        self._sleep_with_backoff(backoff)
+                        backoff = min(backoff * 2, self._backoff_max)
+                    continue
                 try:
-                    self.send(
-                        framed
-                    )  # uses SocketHandler.send; raises on error
+                    # One write for the whole batch; raises on error
+                    self._send_batch(batch)
                 except Exception:
-                    # Put back to queue head if possible (best-effort)
                     self.sock = None
-                    try:
-                        self._q.put_nowait((record, framed))
-                    except queue.Full:
-                        # queue already full; fallback to file
-                        if self._fallback:
-                            self._fallback.emit(record)
+                    self._requeue(batch)
                     # fall through to backoff
                     self._sleep_with_backoff(backoff)
                     backoff = min(backoff * 2, self._backoff_max)
-            except queue.Empty:
-                # No data; loop again (and reconnect if needed)
-                if self.sock is None:
-                    self._sleep_with_backoff(backoff)
-                    backoff = min(backoff * 2, self._backoff_max)
-                continue
             except Exception:
                 # Any unexpected error: drop socket, backoff, continue
                 self.sock = None
                 self._sleep_with_backoff(backoff)
                 backoff = min(backoff * 2, self._backoff_max)
 
+    def _take_batch(self, timeout: float) -> List[logging.LogRecord]:
+        # Wait up to `timeout` for a record, then take what is queued
+        with self._cv:
+            dq = self._dq
+            if not dq:
+                self._cv.wait(timeout)
+            popleft = dq.popleft
+            return [popleft() for _ in range(min(len(dq), _SEND_BATCH))]
+
+    def _requeue(self, batch: List[logging.LogRecord]):
+        # Put an unsent batch back at the head, in order (best-effort). What
+        # no longer fits goes to the fallback file.
+        overflow = []
+        with self._cv:
+            dq = self._dq
+            for record in reversed(batch):
+                if dq.maxlen is None or len(dq) < dq.maxlen:
+                    dq.appendleft(record)
+                else:
+                    overflow.append(record)
+        if self._fallback:
+            for record in reversed(overflow):
+                self._fallback.emit(record)
+
+    def _pickle_payload(self, record: logging.LogRecord) -> bytes:
+        # Same payload as SocketHandler.makePickle, without the length header
+        if record.exc_info:
+            self.format(record)  # caches the traceback text in exc_text
+        d = dict(record.__dict__)
+        d["msg"] = record.getMessage()
+        d["args"] = None
+        d["exc_info"] = None
+        d.pop("message", None)
+        return pickle.dumps(d, 1)
+
+    def _send_batch(self, batch: List[logging.LogRecord]):
+        end = self._frame_batch(batch)
+        # Views must be released before the buffer can be resized again
+        with memoryview(self._buf) as view, view[:end] as frames:
+            self.sock.sendall(frames)
+
+    def _frame_batch(self, batch: List[logging.LogRecord]) -> int:
+        # Length-prefixed frames, back to back, written over the reused
+        # buffer; returns the end offset. A record that cannot be encoded
+        # goes to the fallback file instead of failing the batch.
+        encode = self._encode
+        buf = self._buf
+        end = 0
+        for record in batch:
+            try:
+                payload = encode(record)
+            except Exception:
+                if self._fallback:
+                    self._fallback.emit(record)
+                continue
+            size = len(payload)
+            stop = end + _LEN_HEADER.size + size
+            if stop > len(buf):
+                buf.extend(bytes(stop - len(buf)))  # grow once, kept after
+            _PACK_LEN_INTO(buf, end, size)
+            # Same-length slice assignment: no reallocation
+            buf[end + _LEN_HEADER.size : stop] = payload
+            end = stop
+        return end
+
     def _try_connect(self):
         # Non-blocking-ish connect with short timeout
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -4,42 +4,160 @@ This module provides a LogSubscriber class that allows different UI components
 or non-UI components to subscribe to log messages.
 """
 
-from typing import Callable, List
+import logging
+import threading
+import types
+import weakref
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# Reports failing subscribers. It does not propagate, so the report cannot
+# loop back through the handlers that feed this subscriber.
+_logger = logging.getLogger(__name__)
+_logger.propagate = False
+
+# A subscriber as stored: calling it returns the callback, or None once the
+# callback's owner has been garbage collected.
+_SubscriberRef = Callable[[], Optional[Callable[[str], None]]]
 
 
 class LogSubscriber:
     """
     LogSubscriber class.
     This class allows different UI components or non-UI components to subscribe to log messages.
+
+    Handlers notify on a channel (e.g. "console", "qt"). A subscriber may
+    restrict itself to some channels; by default it receives every channel.
+    A handler whose channel has no listener skips formatting, so wiring
+    several handlers only costs for the channels actually consumed.
+
+    Bound methods are held weakly: a widget that subscribed its own method
+    is dropped from the subscribers once it is garbage collected, instead
+    of being kept alive by them. Other callables are held strongly, so a
+    lambda subscribed without keeping a reference still works.
     """
 
-    def __init__(self):
-        self.subscribers: List[Callable[[str], None]] = []
+    _subs: Tuple[_SubscriberRef, ...]
+    _channels: Dict[str, Tuple[_SubscriberRef, ...]]
+    _routes: Dict[str, Tuple[_SubscriberRef, ...]]
+    _lock: threading.RLock
 
     def __new__(cls, *args, **kwargs):
         if not hasattr(cls, "instance"):
-            cls.instance = super(LogSubscriber, cls).__new__(cls)
+            instance = super(LogSubscriber, cls).__new__(cls)
+            # State is set up here, once, rather than in an __init__ that
+            # every LogSubscriber() call would re-run, dropping subscribers.
+            # Copy-on-write: subscribe swaps in new tuples/dicts under the
+            # lock, so notify reads a stable snapshot without locking.
+            instance._subs = ()  # subscribers of every channel
+            instance._channels = {}  # channel -> channel-only subscribers
+            instance._routes = {}  # channel -> everyone to notify on it
+            # Reentrant: a reaping weakref callback may fire from garbage
+            # collection while this thread is inside subscribe().
+            instance._lock = threading.RLock()
+            cls.instance = instance
         return cls.instance
 
-    def subscribe(self, callback: Callable[[str], None]):
+    def __bool__(self) -> bool:
+        """
+        Whether anyone is subscribed, on any channel.
+
+        :return: True if there is at least one subscriber.
+        :rtype: bool
+        """
+        return bool(self._subs or self._channels)
+
+    @property
+    def subscribers(self) -> Tuple[Callable[[str], None], ...]:
+        """The live subscribers of every channel, as a snapshot."""
+        live = (ref() for ref in self._subs)
+        return tuple(cb for cb in live if cb is not None)
+
+    def has_listeners(self, channel: Optional[str] = None) -> bool:
+        """
+        Whether a message on `channel` would reach anyone.
+
+        :param channel: The channel, or None for untagged messages.
+        :type channel: Optional[str]
+
+        :return: True if notify on this channel has subscribers to call.
+        :rtype: bool
+        """
+        return bool(self._routes.get(channel, self._subs))
+
+    def subscribe(
+        self,
+        callback: Callable[[str], None],
+        channels: Optional[Iterable[str]] = None,
+    ):
         """
         Subscribe a new callback to receive log messages.
 
         :param callback: A function that handles log messages.
         :type callback: Callable[[str], None]
+
+        :param channels: Channels to receive; None receives all of them.
+        :type channels: Optional[Iterable[str]]
         """
 
-        self.subscribers.append(callback)
+        ref: _SubscriberRef
+        if isinstance(callback, types.MethodType):
+            ref = weakref.WeakMethod(callback, self._reap)
+        else:
+
+            def ref():
+                return callback
 
-    def notify(self, message: str):
+        with self._lock:
+            if channels is None:
+                self._subs = self._subs + (ref,)
+            else:
+                by_channel = dict(self._channels)
+                for channel in channels:
+                    by_channel[channel] = by_channel.get(channel, ()) + (ref,)
+                self._channels = by_channel
+            self._update_routes()
+
+    def _reap(self, _dead: weakref.ref):
+        # A weakly held subscriber died: drop every dead reference.
+        with self._lock:
+            self._subs = tuple(ref for ref in self._subs if ref() is not None)
+            channels = {}
+            for channel, refs in self._channels.items():
+                alive = tuple(ref for ref in refs if ref() is not None)
+                if alive:
+                    channels[channel] = alive
+            self._channels = channels
+            self._update_routes()
+
+    def _update_routes(self):
+        self._routes = {
+            channel: self._subs + only
+            for channel, only in self._channels.items()
+        }
+
+    def notify(self, message: str, channel: Optional[str] = None):
         """
-        Notify all subscribers with a new log message.
+        Notify the subscribers of `channel` with a new log message.
+
+        A failing subscriber is reported and does not stop the others.
 
         :param message: The log message.
         :type message: str
+
+        :param channel: The channel of the message, or None for untagged.
+        :type channel: Optional[str]
         """
-        for subscriber in self.subscribers:
-            subscriber(message)
+        for ref in self._routes.get(channel, self._subs):
+            subscriber = ref()
+            if subscriber is None:
+                continue  # collected; _reap is removing it
+            try:
+                subscriber(message)
+            # Justification: one broken subscriber must not break logging
+            # pylint: disable=broad-exception-caught
+            except Exception:
+                _logger.exception("Log subscriber %r failed", subscriber)
+            # pylint: enable=broad-exception-caught
 
 
 log_subscriber = LogSubscriber()
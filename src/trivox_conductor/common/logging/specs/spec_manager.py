@@ -5,10 +5,12 @@ and convert them to dictionary configurations suitable for logging.config.dictCo
 """
 
 import os
-from typing import Any, Dict
+from dataclasses import replace
+from typing import Any, Dict, Optional
 
 from .formatter_spec import FormatterSpec
 from .handler_spec import HandlerSpec
+from .logger_spec import LoggerSpec
 from .logging_spec import LoggingSpec
 from .root_spec import RootSpec
 
@@ -18,15 +20,211 @@ DEFAULT_FORMAT = (
     "%(message)s (%(filename)s:%(lineno)d)"
 )
 
+# TODO: This path should be configurable
+_LOG_FILE = ".trivox_conductor/logs/trivox_conductor.log"
+_SOCKET_FALLBACK_FILE = os.path.join(
+    os.getenv("APPDATA", "C:\\Temp"), "Trivox", "logs", "producer_fallback.log"
+)
+
+
+def _build_default_spec() -> LoggingSpec:
+    """
+    Build the default LoggingSpec with sensible defaults.
+
+    :return: A LoggingSpec instance with default configuration.
+    :rtype: LoggingSpec
+    """
+    spec = LoggingSpec()
+    spec.filters["ensure_classname"] = {
+        "()": "trivox_conductor.common.logging.filters.EnsureClassName"
+    }
+    spec.formatters["console_color"] = FormatterSpec(
+        class_name="trivox_conductor.common.logging.formatters.ConsoleColorFormatter",
+        scope="console_color",
+        params={
+            "fmt": DEFAULT_FORMAT,  # reuse your rich format
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        },
+    )
+    spec.handlers["console_stream"] = HandlerSpec(
+        class_name="logging.StreamHandler",
+        level="DEBUG",
+        formatter="console_color",
+        filters=["ensure_classname"],
+        params={"stream": "ext://sys.stdout"},
+    )
+    spec.handlers["file"] = HandlerSpec(
+        class_name="logging.handlers.RotatingFileHandler",
+        level="DEBUG",
+        formatter="console_color",  # not "rich"
+        filters=["ensure_classname"],
+        params={
+            "filename": _LOG_FILE,
+            "maxBytes": 5_000_000,
+            "backupCount": 3,
+            "encoding": "utf-8",
+            "delay": True,  # delay opening until first emit
+        },
+    )
+    spec.handlers["socket"] = HandlerSpec(
+        class_name="trivox_conductor.common.logging.handlers.RobustSocketLogger",
+        scope="socket_handler",
+        level="DEBUG",
+        formatter="console_color",
+        filters=["ensure_classname"],
+        params={
+            "host": "127.0.0.1",
+            "port": 9999,
+            "queue_maxsize": 5000,
+            "fallback_file": _SOCKET_FALLBACK_FILE,
+            "backoff_min": 0.25,
+            "backoff_max": 8.0,
+        },
+    )
+    spec.root = RootSpec(level="DEBUG", handlers=["console_stream", "file"])
+    return spec
+
+
+def _copy_spec(spec: LoggingSpec) -> LoggingSpec:
+    # Copies every mutable container (dictConfig pops keys out of the filter
+    # dicts it is given), sharing only immutable values.
+    return LoggingSpec(
+        disable_existing_loggers=spec.disable_existing_loggers,
+        filters={k: dict(v) for k, v in spec.filters.items()},
+        formatters={
+            k: replace(v, params=dict(v.params))
+            for k, v in spec.formatters.items()
+        },
+        handlers={
+            k: replace(v, filters=list(v.filters), params=dict(v.params))
+            for k, v in spec.handlers.items()
+        },
+        loggers={
+            k: replace(v, handlers=list(v.handlers))
+            for k, v in spec.loggers.items()
+        },
+        root=replace(spec.root, handlers=list(spec.root.handlers)),
+    )
+
+
+def _copy_tree(value: Any) -> Any:
+    # Structural copy of a dict/list tree of plain values; much cheaper than
+    # copy.deepcopy since there are no cycles or custom objects to track.
+    if isinstance(value, dict):
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(v) for v in value]
+    return value
+
+
+# Built once at import; every SpecManager starts from a copy of it.
+_DEFAULT_SPEC = _build_default_spec()
+
 
 class SpecManager:
     """
     Manages logging specifications and provides methods to convert them to
     dictionary configurations suitable for logging.config.dictConfig.
+
+    The dictConfig is built once and reused; change the spec through the
+    mutators below (or set_spec) so it is rebuilt. Editing `spec` in place
+    is not tracked.
     """
 
     def __init__(self):
         self._spec = self._default_spec()
+        # to_dict_config() result for the current spec; None when stale
+        self._dict_config: Optional[Dict[str, Any]] = None
+
+    @property
+    def spec(self) -> LoggingSpec:
+        """The LoggingSpec being managed."""
+        return self._spec
+
+    def set_spec(self, spec: LoggingSpec):
+        """
+        Replace the managed LoggingSpec.
+
+        :param spec: The new logging specification.
+        :type spec: LoggingSpec
+        """
+        self._spec = spec
+        self._dict_config = None
+
+    def add_filter(self, name: str, config: Dict[str, Any]):
+        """
+        Add or replace a filter.
+
+        :param name: The filter name handlers refer to.
+        :type name: str
+
+        :param config: The dictConfig entry of the filter.
+        :type config: Dict[str, Any]
+        """
+        self._spec.filters[name] = config
+        self._dict_config = None
+
+    def add_formatter(self, name: str, formatter: FormatterSpec):
+        """
+        Add or replace a formatter.
+
+        :param name: The formatter name handlers refer to.
+        :type name: str
+
+        :param formatter: The formatter specification.
+        :type formatter: FormatterSpec
+        """
+        self._spec.formatters[name] = formatter
+        self._dict_config = None
+
+    def add_handler(self, name: str, handler: HandlerSpec):
+        """
+        Add or replace a handler.
+
+        :param name: The handler name loggers refer to.
+        :type name: str
+
+        :param handler: The handler specification.
+        :type handler: HandlerSpec
+        """
+        self._spec.handlers[name] = handler
+        self._dict_config = None
+
+    def remove_handler(self, name: str):
+        """
+        Remove a handler, and every reference loggers make to it.
+
+        :param name: The handler name.
+        :type name: str
+        """
+        self._spec.handlers.pop(name, None)
+        for logger in (*self._spec.loggers.values(), self._spec.root):
+            if name in logger.handlers:
+                logger.handlers = [h for h in logger.handlers if h != name]
+        self._dict_config = None
+
+    def add_logger(self, name: str, logger: LoggerSpec):
+        """
+        Add or replace a named logger.
+
+        :param name: The logger name.
+        :type name: str
+
+        :param logger: The logger specification.
+        :type logger: LoggerSpec
+        """
+        self._spec.loggers[name] = logger
+        self._dict_config = None
+
+    def set_root(self, root: RootSpec):
+        """
+        Replace the root logger specification.
+
+        :param root: The root logger specification.
+        :type root: RootSpec
+        """
+        self._spec.root = root
+        self._dict_config = None
 
     def _default_spec(self) -> LoggingSpec:
         """
@@ -35,66 +233,7 @@ class SpecManager:
         :return: A LoggingSpec instance with default configuration.
         :rtype: LoggingSpec
         """
-        spec = LoggingSpec()
-        spec.filters["ensure_classname"] = {
-            "()": "trivox_conductor.common.logging.filters.EnsureClassName"
-        }
-        spec.formatters["console_color"] = FormatterSpec(
-            class_name="trivox_conductor.common.logging.formatters.ConsoleColorFormatter",
-            scope="console_color",
-            params={
-                "fmt": DEFAULT_FORMAT,  # reuse your rich format
-                "datefmt": "%Y-%m-%d %H:%M:%S",
-            },
-        )
-        spec.handlers["console_stream"] = HandlerSpec(
-            class_name="logging.StreamHandler",
-            level="DEBUG",
-            formatter="console_color",
-            filters=["ensure_classname"],
-            params={"stream": "ext://sys.stdout"},
-        )
-        spec.handlers["file"] = HandlerSpec(
-            class_name="logging.handlers.RotatingFileHandler",
-            level="DEBUG",
-            formatter="console_color",  # not "rich"
-            filters=["ensure_classname"],
-            params={
-                # TODO: This path should be configurable
-                "filename": ".trivox_conductor/logs/trivox_conductor.log",
-                "maxBytes": 5_000_000,
-                "backupCount": 3,
-                "encoding": "utf-8",
-                "delay": True,  # delay opening until first emit
-            },
-        )
-        spec.handlers["socket"] = HandlerSpec(
-            class_name="trivox_conductor.common.logging.handlers.RobustSocketLogger",
-            scope="socket_handler",
-            level="DEBUG",
-            formatter="console_color",
-            filters=["ensure_classname"],
-            params={
-                "host": "127.0.0.1",
-                "port": 9999,
-                "queue_maxsize": 5000,
-                "fallback_file": (
-                    os.path.join(
-                        os.getenv("APPDATA", "C:\\Temp"),
-                        "Trivox",
-                        "logs",
-                        "producer_fallback.log",
-                    )
-                ),
-                "backoff_min": 0.25,
-                "backoff_max": 8.0,
-            },
-        )
-        spec.root = RootSpec(
-            level="DEBUG", handlers=["console_stream", "file"]
-        )
-        self._spec = spec
-        return spec
+        return _copy_spec(_DEFAULT_SPEC)
 
     def to_dict_config(self) -> Dict[str, Any]:
         """
@@ -106,6 +245,12 @@ class SpecManager:
         :return: A dictionary representation of the logging configuration.
         :rtype: dict
         """
+        if self._dict_config is None:
+            self._dict_config = self._build_dict_config()
+        # dictConfig mutates the dict it is given: hand out a copy
+        return _copy_tree(self._dict_config)
+
+    def _build_dict_config(self) -> Dict[str, Any]:
         return {
             "version": 1,
             "disable_existing_loggers": self._spec.disable_existing_loggers,
@@ -1,8 +1,38 @@
 
 import importlib
+import importlib.util
+import logging
 import os
-import pkgutil
-from typing import List, Optional
+import sys
+from typing import FrozenSet, List, Optional
+
+_logger = logging.getLogger(__name__)
+
+# Packages imported while bootstrapping the application (commands, settings
+# and local plugins). Their bytecode is what `precompile_modules` warms up.
+BOOTSTRAP_PACKAGES = (
+    "trivox_conductor.common",
+    "trivox_conductor.core",
+    "trivox_conductor.modules",
+    "trivox_conductor.plugins",
+)
+
+
+def _scan_files(path: str) -> FrozenSet[str]:
+    """
+    Names of the regular files directly inside `path` (one scandir pass).
+
+    :param path: Directory to scan
+    :type path: str
+
+    :return: The file names, empty if the directory cannot be read
+    :rtype: FrozenSet[str]
+    """
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it if entry.is_file())
+    except OSError:
+        return frozenset()
 
 
 def load_specific_modules(package: object, required_files: List[str]):
@@ -16,18 +46,30 @@ def load_specific_modules(package: object, required_files: List[str]):
     :type required_files: List[str]
     """
 
-    for _, module_name, _ in pkgutil.iter_modules(package.__path__):
-        full_module_name = f"{package.__name__}.{module_name}"
-        module_path = os.path.join(package.__path__[0], module_name)
+    required = frozenset(required_files)
+    prefix = f"{package.__name__}."
+    import_module = importlib.import_module
 
-        if os.path.isdir(module_path):
-            # Check if required files exist in the module's directory
-            if any(
-                os.path.isfile(os.path.join(module_path, file))
-                for file in required_files
-            ):
-                # Import the module if it contains any of the required files
-                importlib.import_module(full_module_name)
+    # One scandir of the package and one per subdirectory; DirEntry carries
+    # the entry type, so nothing is stat'ed file by file.
+    try:
+        with os.scandir(package.__path__[0]) as it:
+            subdirs = [
+                (entry.name, entry.path)
+                for entry in it
+                if entry.name.isidentifier() and entry.is_dir()
+            ]
+    except OSError:
+        return
+    # Same (sorted) order as pkgutil.iter_modules
+    subdirs.sort()
+
+    for module_name, module_path in subdirs:
+        files = _scan_files(module_path)
+        # Only regular packages, as pkgutil.iter_modules reports them
+        if "__init__.py" in files and not required.isdisjoint(files):
+            # Import the module if it contains any of the required files
+            import_module(prefix + module_name)
 
 
 def try_import(module_name: str) -> Optional[object]:
@@ -41,11 +83,15 @@ def try_import(module_name: str) -> Optional[object]:
     :rtype: Optional[object]
     """
 
-    try:
-        module = __import__(module_name, fromlist=[""])
+    # Already imported: skip the import machinery and its lock
+    module = sys.modules.get(module_name)
+    if module is not None:
         return module
+    try:
+        return importlib.import_module(module_name)
     except ImportError as e:
-        print(f"Failed to import {module_name}: {e}")
+        # %-style: formatted only if a handler actually emits it
+        _logger.warning("Failed to import %s: %s", module_name, e)
         return None
 
 
@@ -72,3 +118,35 @@ def load_all_modules():
         module = try_import(module_name)
         if module:
             load_specific_modules(module, required_files)
+
+
+def precompile_modules(package_names: Optional[List[str]] = None) -> bool:
+    """
+    Byte-compile packages into their ``__pycache__`` folders.
+
+    Running this once after installing or updating the application lets the
+    next start load cached bytecode instead of compiling every module that
+    the bootstrap imports. Up-to-date ``.pyc`` files are left untouched.
+
+    :param package_names: Packages to compile, defaults to BOOTSTRAP_PACKAGES
+    :type package_names: Optional[List[str]]
+
+    :return: True if every module compiled successfully
+    :rtype: bool
+    """
+
+    # Justification: compileall (and py_compile) are only needed by the warmup
+    # command; importing them here keeps them off every CLI start.
+    # pylint: disable=import-outside-toplevel
+    import compileall
+
+    ok = True
+    for package_name in package_names or BOOTSTRAP_PACKAGES:
+        spec = importlib.util.find_spec(package_name)
+        if spec is None or not spec.submodule_search_locations:
+            _logger.warning("Failed to locate package %s", package_name)
+            ok = False
+            continue
+        for path in spec.submodule_search_locations:
+            ok = bool(compileall.compile_dir(path, quiet=1)) and ok
+    return ok
@@ -3,30 +3,73 @@ Typed, safe, and subclass-isolated endpoint registry.
 """
 from __future__ import annotations
 
-from typing import Generic, TypeVar, ClassVar, Mapping, MutableMapping, Iterator, Optional, Type
+from typing import (
+    Callable,
+    Generic,
+    TypeVar,
+    ClassVar,
+    Iterable,
+    ItemsView,
+    Mapping,
+    MutableMapping,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+)
 import threading
 import re
 from abc import ABC
+from functools import lru_cache
 
 T = TypeVar("T")  # endpoint implementation type (classes deriving from endpoint_base)
 
 
+@lru_cache(maxsize=256)
+def _compile_ci(pattern: str) -> re.Pattern:
+    """Case-insensitive pattern, compiled once per distinct query."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class EndpointRegistry(Generic[T]):
     """
     A registry of *classes* implementing a specific endpoint interface.
 
     Subclasses **must** set `endpoint_base` to the ABC (or base class) that all
     endpoint implementations derive from.
+
+    Reads are lock-free: they rely on single dict operations being atomic
+    under the GIL. Only mutations take `_lock`, a plain (non-reentrant) Lock,
+    so a mutator must never call another mutator while holding it.
     """
 
     endpoint_base: ClassVar[type] = ABC  # override in subclasses
     _registry: ClassVar[MutableMapping[str, Type[T]]]
-    _lock: ClassVar[threading.RLock]
+    _lock: ClassVar[threading.Lock]
+    _version: ClassVar[int]  # bumped on every mutation; keys derived caches
+    # (version, ((lowercased name, class), ...)) for case-insensitive search
+    _lower_index: ClassVar[
+        Optional[tuple[int, tuple[tuple[str, Type[T]], ...]]]
+    ]
+    # Bound methods of the current _registry dict, for hot callers: a lookup
+    # through them is a single C-level dict operation, with no classmethod
+    # dispatch. _fast_get raises a bare KeyError; use get() for the message.
+    _fast_get: ClassVar[Callable[[str], Type[T]]]
+    _fast_contains: ClassVar[Callable[[str], bool]]
 
     def __init_subclass__(cls, **kwargs):  # type: ignore[override]
         super().__init_subclass__(**kwargs)
-        cls._registry = {}
-        cls._lock = threading.RLock()
+        cls._lock = threading.Lock()
+        cls._version = 0
+        cls._lower_index = None
+        cls._bind_registry({})
+
+    @classmethod
+    def _bind_registry(cls, registry: dict[str, Type[T]]) -> None:
+        # The fast accessors are bound to one dict: rebind them with it.
+        cls._registry = registry
+        cls._fast_get = registry.__getitem__
+        cls._fast_contains = registry.__contains__
 
     @staticmethod
     def _infer_name(impl_class: type) -> str:
@@ -42,11 +85,39 @@ class EndpointRegistry(Generic[T]):
             if not replace and name in cls._registry:
                 raise KeyError(f"Endpoint '{name}' already registered")
             cls._registry[name] = impl_class
+            cls._version += 1
+
+    @classmethod
+    def register_many(
+        cls, pairs: Iterable[Tuple[str, Type[T]]], *, replace: bool = False
+    ) -> None:
+        """Register several endpoints under a single lock acquisition.
+
+        The batch is all-or-nothing: nothing is registered if any entry fails
+        validation or collides with an existing (or earlier batched) name.
+        """
+        batch: dict[str, Type[T]] = {}
+        for name, impl_class in pairs:
+            if not issubclass(impl_class, cls.endpoint_base):
+                raise TypeError(
+                    f"{impl_class.__qualname__} must subclass {cls.endpoint_base.__qualname__}"
+                )
+            if not replace and name in batch:
+                raise KeyError(f"Endpoint '{name}' already registered")
+            batch[name] = impl_class
+        with cls._lock:
+            if not replace:
+                for name in batch:
+                    if name in cls._registry:
+                        raise KeyError(f"Endpoint '{name}' already registered")
+            cls._registry.update(batch)
+            cls._version += 1
 
     @classmethod
     def unregister(cls, name: str) -> None:
         with cls._lock:
             cls._registry.pop(name, None)
+            cls._version += 1
 
     @classmethod
     def endpoint(cls, name: Optional[str] = None, *, replace: bool = False):
@@ -59,7 +130,7 @@ class EndpointRegistry(Generic[T]):
     @classmethod
     def get(cls, name: str) -> Type[T]:
         try:
-            return cls._registry[name]
+            return cls._fast_get(name)
         except KeyError as e:
             raise KeyError(f"Unknown endpoint '{name}'") from e
 
@@ -69,7 +140,7 @@ class EndpointRegistry(Generic[T]):
 
     @classmethod
     def contains(cls, name: str) -> bool:
-        return name in cls._registry
+        return cls._fast_contains(name)
 
     @classmethod
     def all(cls) -> Mapping[str, Type[T]]:
@@ -79,14 +150,35 @@ class EndpointRegistry(Generic[T]):
     def names(cls) -> list[str]:
         return list(cls._registry.keys())
 
+    @classmethod
+    def items(cls) -> ItemsView[str, Type[T]]:
+        """Live (name, class) view; unlike all(), no snapshot is copied."""
+        return cls._registry.items()
+
+    @classmethod
+    def version(cls) -> int:
+        """Mutation counter; changes whenever the registry contents change."""
+        return cls._version
+
+    @classmethod
+    def _lowered(cls) -> tuple[tuple[str, Type[T]], ...]:
+        """Names lowercased once per registry version, paired with classes."""
+        cached = cls._lower_index
+        if cached is None or cached[0] != cls._version:
+            lowered = tuple(
+                (key.lower(), impl) for key, impl in cls._registry.items()
+            )
+            cached = cls._lower_index = (cls._version, lowered)
+        return cached[1]
+
     @classmethod
     def find_contains(cls, needle: str) -> list[Type[T]]:
         n = needle.lower()
-        return [impl for key, impl in cls._registry.items() if n in key.lower()]
+        return [impl for key, impl in cls._lowered() if n in key]
 
     @classmethod
     def find_regex(cls, pattern: str) -> list[Type[T]]:
-        rx = re.compile(pattern, re.IGNORECASE)
+        rx = _compile_ci(pattern)
         return [impl for key, impl in cls._registry.items() if rx.search(key)]
 
     @classmethod
@@ -97,7 +189,10 @@ class EndpointRegistry(Generic[T]):
     @classmethod
     def clear(cls) -> None:
         with cls._lock:
-            cls._registry.clear()
+            # Rebind rather than empty in place: a reader iterating the old
+            # mapping finishes on it instead of seeing it change size.
+            cls._bind_registry({})
+            cls._version += 1
 
     @classmethod
     def __iter__(cls) -> Iterator[tuple[str, Type[T]]]:  # pragma: no cover
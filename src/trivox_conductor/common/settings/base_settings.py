@@ -13,7 +13,12 @@ class BaseSettings(ABC):
 
     Subclasses can set a class-level `name`. If omitted, the registry infers it
     from the class name (lowercased).
+
+    Instances only hold `data`; subclasses declare ``__slots__ = ()`` so they
+    stay free of a per-instance ``__dict__``.
     """
+    __slots__ = ("data",)
+
     name: ClassVar[Optional[str]] = None
 
     def __init__(self, data: Optional[dict[str, JSONScalar]] = None) -> None:
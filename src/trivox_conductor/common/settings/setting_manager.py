@@ -1,14 +1,62 @@
 
+import copy
 import os
 from abc import ABC, abstractmethod
-from typing import Optional
-
-import yaml
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
 
 from trivox_conductor.common.settings.setting_merger import SettingMerger
 from trivox_conductor.common.settings.settings_registry import SettingRegistry
 
 
+@lru_cache(maxsize=None)
+def _yaml_codec() -> tuple:
+    """
+    Import PyYAML on first use, preferring the libyaml bindings, which give
+    the same results but parse and emit in C.
+
+    :return: The yaml module, its loader and its dumper.
+    :rtype: tuple
+    """
+    # Justification: yaml is only needed once a settings file is read or
+    # written, not to import the settings classes.
+    # pylint: disable=import-outside-toplevel
+    import yaml
+
+    try:
+        from yaml import CDumper as Dumper
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import Dumper  # type: ignore[assignment]
+        from yaml import SafeLoader as Loader  # type: ignore[assignment]
+    # pylint: enable=import-outside-toplevel
+    return yaml, Loader, Dumper
+
+
+@lru_cache(maxsize=32)
+def _read_yaml(file_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a YAML file, memoized on its path and stat signature.
+
+    :param file_path: The path to the YAML file.
+    :type file_path: str
+
+    :param mtime_ns: The file modification time, part of the cache key.
+    :type mtime_ns: int
+
+    :param size: The file size, part of the cache key.
+    :type size: int
+
+    :return: The parsed data.
+    :rtype: dict
+    """
+    # Justification: mtime_ns and size only key the cache.
+    # pylint: disable=unused-argument
+    yaml, loader, _ = _yaml_codec()
+    with open(file_path, "rb") as file:
+        return yaml.load(file.read(), Loader=loader) or {}
+
+
 class SettingsManager(ABC):
     """
     Manager for all settings.
@@ -19,8 +67,23 @@ class SettingsManager(ABC):
     _user_settings: Optional[dict] = None
 
     _setting_path: Optional[str] = None
-    _configuration_descriptor = (
-        f"{os.getenv('TRIVOX_CONFIG_PATH', os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', '.trivox_conductor/settings'))}/"
+    # (SettingRegistry version, module -> default data) of the last build
+    _registry_defaults: Optional[Tuple[int, Dict[str, dict]]] = None
+    # Made absolute and normalized once, so the paths joined onto it carry
+    # no ".." segments to resolve on every file operation.
+    _configuration_descriptor = os.path.abspath(
+        os.getenv(
+            "TRIVOX_CONFIG_PATH",
+            os.path.join(
+                os.path.dirname(__file__),
+                "..",
+                "..",
+                "..",
+                "..",
+                ".trivox_conductor",
+                "settings",
+            ),
+        )
     )
 
     def __init__(self):
@@ -29,45 +92,61 @@ class SettingsManager(ABC):
         - Set the environment variable for the IC Inspector path if it does not exist.
         - Create the settings file if it does not exist.
         """
-        self.__ensure_directory()
+        existing = self.__ensure_directory()
         self.default_file = self.__set_setting_file(
-            self._configuration_descriptor, "default-settings.yml"
+            self._configuration_descriptor, "default-settings.yml", existing
         )
         self.user_file = self.__set_setting_file(
-            self._configuration_descriptor, "user-settings.yml"
+            self._configuration_descriptor, "user-settings.yml", existing
         )
 
         self.settings_file = self.__set_setting_file(
-            self._configuration_descriptor, "settings.yaml"
+            self._configuration_descriptor, "settings.yaml", existing
         )
 
-        self._load_file(self.settings_file)
-
     @property
     def __get_default_settings(self) -> dict:
         """
         Load the initial data for the settings from the registry.
 
+        The settings classes are only instantiated again once the registry
+        changes; callers get fresh per-module dicts every time.
+
         :return: The initial data for the settings.
         :rtype: dict
         """
 
-        return {
-            module: SettingRegistry.get(module)().data
-            for module in SettingRegistry.names()
-        }
+        version = SettingRegistry.version()
+        cached = SettingsManager._registry_defaults
+        if cached is None or cached[0] != version:
+            cached = SettingsManager._registry_defaults = (
+                version,
+                {
+                    module: setting_cls().data
+                    for module, setting_cls in SettingRegistry.items()
+                },
+            )
+        # Values are flat dicts of scalars: a shallow copy of each is enough.
+        return {module: dict(data) for module, data in cached[1].items()}
 
     @abstractmethod
     def save(self):
         """Save the settings data to the settings file."""
 
-    def __ensure_directory(self):
+    def __ensure_directory(self) -> FrozenSet[str]:
         """
         Ensure that the directory exists.
+
+        :return: The names of the entries already in it (one scandir).
+        :rtype: FrozenSet[str]
         """
         os.makedirs(self._configuration_descriptor, exist_ok=True)
+        with os.scandir(self._configuration_descriptor) as it:
+            return frozenset(entry.name for entry in it)
 
-    def __set_setting_file(self, path: str, name: str) -> str:
+    def __set_setting_file(
+        self, path: str, name: str, existing: FrozenSet[str] = frozenset()
+    ) -> str:
         """
         Set the setting file path.
 
@@ -77,14 +156,24 @@ class SettingsManager(ABC):
         :param name: The name of the settings file.
         :type name: str
 
+        :param existing: Names known to exist in `path`; those are not
+            touched.
+        :type existing: FrozenSet[str]
+
         :return: The path to the settings file.
         :rtype: str
         """
         file_path = os.path.join(path, name)
-        file_path = file_path.replace("\\", "/")
-        if not os.path.exists(file_path):
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write("")
+        if os.sep == "\\":
+            file_path = file_path.replace("\\", "/")
+        if name in existing:
+            return file_path
+        # Exclusive create: one call instead of an existence check + open.
+        try:
+            with open(file_path, "x", encoding="utf-8"):
+                pass
+        except FileExistsError:
+            pass
         return file_path
 
     def _load_file(self, file_path: str) -> dict:
@@ -98,10 +187,14 @@ class SettingsManager(ABC):
         :rtype: dict
         """
 
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             return {}
-        with open(file_path, "r", encoding="utf-8") as file:
-            return yaml.safe_load(file) or {}
+        # Callers mutate what they load, so hand out a copy of the cached data.
+        return copy.deepcopy(
+            _read_yaml(file_path, stat.st_mtime_ns, stat.st_size)
+        )
 
     def _save_file(self, file_path: str, data: dict):
         """
@@ -113,8 +206,11 @@ class SettingsManager(ABC):
         :param data: The settings data.
         :type data: dict
         """
+        yaml, _, dumper = _yaml_codec()
         with open(file_path, "w", encoding="utf-8") as file:
-            yaml.dump(data, file, default_flow_style=False)
+            yaml.dump(data, file, Dumper=dumper, default_flow_style=False)
+        # Coarse filesystem timestamps may not change within the same tick.
+        _read_yaml.cache_clear()
 
     def _get_versions(self) -> tuple:
         """
@@ -138,10 +234,14 @@ class SettingsManager(ABC):
         """
         Ensure that both default and user settings have a version number.
         Initializes the files if they are missing or incomplete.
+        The defaults file is only rewritten when the registry defaults differ
+        from what it holds.
         """
 
-        self._defaults = self.__get_default_settings
-        self._save_file(self.default_file, self._defaults)
+        defaults = self.__get_default_settings
+        if defaults != self._defaults:
+            self._save_file(self.default_file, defaults)
+        self._defaults = defaults
 
         if not self._user_settings:
             self._user_settings = self._defaults.copy()
@@ -150,25 +250,28 @@ class SettingsManager(ABC):
     def _sync_files(self):
         """
         If the default version is newer than the user version, update user settings.
+        The defaults file is already current (see _ensure_settings_content).
         """
 
         updated_user_settings, changes_detected = SettingMerger.merge_settings(
             self._defaults, self._user_settings
         )
 
-        if changes_detected:
+        # merge_settings also counts user overrides as changes; only write
+        # when the merge actually alters the user file.
+        if changes_detected and updated_user_settings != self._user_settings:
             self._save_file(self.user_file, updated_user_settings)
             self._user_settings = updated_user_settings
-            self._save_file(self.default_file, self._defaults)
 
     def _finalize_settings(self):
-        """Merge the final settings for application use and save them."""
+        """Merge the final settings for runtime use; save them if changed."""
 
         self.data = SettingMerger.merge_final(
             self._defaults, self._user_settings
         )
 
-        self.save()
+        if self.data != self._load_file(self.settings_file):
+            self.save()
 
     def _initialize_data(self):
         """
@@ -51,11 +51,11 @@ class SettingMerger:
                 else:
                     changes_detected = True
 
-        # Add new keys from defaults
-        for key, value in defaults.items():
-            if key not in user_settings:
-                merged[key] = value
-                changes_detected = True
+        # New keys from defaults are already in `merged` (it starts as a
+        # copy); they only count as a change. One subset test on the key
+        # views, skipped once a change is known.
+        if not changes_detected:
+            changes_detected = not defaults.keys() <= user_settings.keys()
 
         return merged, changes_detected
 
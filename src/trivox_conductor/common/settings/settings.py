@@ -1,8 +1,6 @@
 
 from typing import Any, Optional
 
-import yaml
-
 from trivox_conductor.common.settings.setting_manager import SettingsManager
 
 
@@ -70,8 +68,7 @@ class Settings(SettingsManager):
         """
         Save the settings data to the settings file.
         """
-        with open(self.settings_file, "w", encoding="utf-8") as file:
-            yaml.dump(self.data, file, default_flow_style=False)
+        self._save_file(self.settings_file, self.data)
 
 
 settings = Settings()
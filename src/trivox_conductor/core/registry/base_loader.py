@@ -1,11 +1,23 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 import importlib
 import os
+import sys
 import yaml  # pip install pyyaml
 
-@dataclass
+PLUGIN_FILE = "plugin.yaml"
+_SKIP_DIRS = frozenset({"__pycache__"})
+# Set TRIVOX_PARALLEL_LOAD=0 to read plugin descriptors sequentially.
+PARALLEL_LOAD_ENV = "TRIVOX_PARALLEL_LOAD"
+# yaml.safe_load is pure Python and holds the GIL, so threads only overlap
+# the file I/O; below this many descriptors the pool costs more than it saves.
+_PARALLEL_MIN_ENTRIES = 16
+
+# Frozen: descriptors are shared through the _read_descriptor cache.
+@dataclass(frozen=True)
 class PluginDescriptor:
     name: str
     role: str
@@ -13,30 +25,65 @@ class PluginDescriptor:
     clazz: str
     version: str
     requires_api: str
-    capabilities: list[str]
+    capabilities: Tuple[str, ...]
     source: str  # "local"
 
+def _scan_plugin_yamls(root: str) -> Iterable[Tuple[str, int]]:
+    # Single scandir pass per directory: DirEntry carries the entry type, so
+    # only the plugin.yaml files themselves are stat'ed (for their mtime).
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS and not entry.name.startswith("."):
+                    yield from _scan_plugin_yamls(entry.path)
+            elif entry.name == PLUGIN_FILE and entry.is_file():
+                yield entry.path, entry.stat().st_mtime_ns
+
 def iter_local_plugin_yamls(root: str) -> Iterable[str]:
-    for dirpath, _dirnames, filenames in os.walk(root):
-        if "plugin.yaml" in filenames:
-            yield os.path.join(dirpath, "plugin.yaml")
+    for yaml_path, _mtime_ns in _scan_plugin_yamls(root):
+        yield yaml_path
+
+@lru_cache(maxsize=None)
+def _read_descriptor(yaml_path: str, mtime_ns: int) -> PluginDescriptor:
+    # mtime_ns is part of the cache key so edited descriptors are re-parsed.
+    # Justification: mtime_ns only keys the cache.
+    # pylint: disable=unused-argument
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return PluginDescriptor(
+        # Identifiers feed registry keys, module paths and getattr; intern
+        # them for lookups.
+        name=sys.intern(data.get("name", "")),
+        role=sys.intern(data.get("role", "")),
+        module=sys.intern(data.get("module", "adapter")),
+        clazz=sys.intern(data.get("class", "Adapter")),
+        version=data.get("version", "0.0.0"),
+        requires_api=data.get("requires_api", ">=1.0,<2.0"),
+        capabilities=tuple(data.get("capabilities", ())),
+        source="local",
+    )
+
+def _read_descriptor_entry(entry: Tuple[str, int]) -> PluginDescriptor:
+    return _read_descriptor(*entry)
 
 def load_descriptors(plugins_root: str) -> List[PluginDescriptor]:
-    descs: List[PluginDescriptor] = []
-    for yaml_path in iter_local_plugin_yamls(plugins_root):
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        descs.append(PluginDescriptor(
-            name=data.get("name", ""),
-            role=data.get("role", ""),
-            module=data.get("module", "adapter"),
-            clazz=data.get("class", "Adapter"),
-            version=data.get("version", "0.0.0"),
-            requires_api=data.get("requires_api", ">=1.0,<2.0"),
-            capabilities=data.get("capabilities", []),
-            source="local",
-        ))
-    return descs
+    entries = list(_scan_plugin_yamls(plugins_root))
+    if (
+        len(entries) < _PARALLEL_MIN_ENTRIES
+        or os.getenv(PARALLEL_LOAD_ENV, "1") == "0"
+    ):
+        return [_read_descriptor_entry(entry) for entry in entries]
+    # Descriptors are independent files: overlap their reads.
+    # map() keeps discovery order so registration stays deterministic.
+    workers = min(len(entries), os.cpu_count() or 1)
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="PluginDescriptorLoader"
+    ) as pool:
+        return list(pool.map(_read_descriptor_entry, entries))
 
 def import_adapter_from_descriptor(desc: PluginDescriptor, pkg_root: str):
     """
@@ -45,5 +92,9 @@ def import_adapter_from_descriptor(desc: PluginDescriptor, pkg_root: str):
       trivox_conductor.plugins.capture_obs.adapter:OBSAdapter
     """
     mod_path = f"{pkg_root}.plugins.{desc.name}.{desc.module}".replace("-", "_")
-    mod = importlib.import_module(mod_path)
+    # Already-imported adapters (re-init, or a package __init__ that imports
+    # its adapter) resolve straight from sys.modules.
+    mod = sys.modules.get(mod_path)
+    if mod is None:
+        mod = importlib.import_module(mod_path)
     return getattr(mod, desc.clazz)
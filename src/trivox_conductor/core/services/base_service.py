@@ -90,6 +90,7 @@ class BaseService(Generic[TConf, TAdapter]):
         """
         self._registry = registry
         self._settings: TConf = self._load_config(settings)
+        self._settings_snapshot: Optional[Mapping[str, Any]] = None
 
     def _load_config(self, settings: Mapping[str, Any]) -> TConf:
         raw = settings.get(self.SECTION, {}) or {}
@@ -109,8 +110,17 @@ class BaseService(Generic[TConf, TAdapter]):
         return adapter
 
     def _settings_dict(self) -> Mapping[str, Any]:
-        settings = self._settings
-        return asdict(settings) if is_dataclass(settings) else dict(settings)  # supports dataclass or pydantic
+        # The typed settings are loaded once per service, so convert them once
+        # too; callers copy the snapshot before layering overrides on it.
+        if self._settings_snapshot is None:
+            settings = self._settings
+            # Supports dataclass or pydantic settings.
+            self._settings_snapshot = (
+                asdict(settings)
+                if is_dataclass(settings)
+                else dict(settings)
+            )
+        return self._settings_snapshot
 
     def _configure_adapter(self, adapter: TAdapter, *, overrides: Mapping[str, Any] = None, secrets: Mapping[str, Any] = None) -> Mapping[str, Any]:
         base = dict(self._settings_dict())
@@ -1,5 +1,5 @@
 
-from trivox_conductor.common.logger import logger
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.common.base_command import TrivoxConductorCommand
 from trivox_conductor.common.commands.base_command import register_command
 from trivox_conductor.common.commands.argument_type import ArgumentType
@@ -35,6 +35,8 @@ class AICommand(TrivoxConductorCommand):
 
     def _execute(self, **kwargs):
         # Implement the command execution logic here
-        logger.debug(f"Executing AICommand with kwargs: {kwargs}")
+        get_class_logger(self).debug(
+            "Executing AICommand with kwargs: %s", kwargs
+        )
         self.set_processor(AIBrainCommandProcessor)
         self._run(**kwargs)
@@ -1,38 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-from trivox_conductor.common.logger import logger
 from trivox_conductor.common.settings import settings
 from trivox_conductor.common.base_processor import TrivoxCaptureCommandProcessor
 from trivox_conductor.core.registry.ai_registry import AIRegistry
 
-from .services import AIBrainService, BeatMarkerService
+if TYPE_CHECKING:
+    from .services import AIBrainService, BeatMarkerService
 
 
 class AIBrainCommandProcessor(TrivoxCaptureCommandProcessor):
     """
     Command processor for AI Brain module commands.
     """
+
+    __slots__ = ()
     
-    def __init__(self, **kwargs):
-        self._action: str = kwargs.get("action", "")
-    
-    def run(self):
-        # Implement the command processing logic here
-        logger.debug("Running AIBrainCommandProcessor")
-
-        if self._action == "generate":
-            svc = AIBrainService(AIRegistry, settings)
-        elif self._action == "markers":
-            svc = BeatMarkerService(AIRegistry, settings)
-
-        ops = {
-            "generate": lambda: svc.generate({}),
-            "markers": lambda: svc.markers_from_features({}),
-        }
-        try:
-            fn = ops[self._action]
-        except KeyError as e:
-            raise ValueError(f"Unknown action: {self._action}") from e
-
-        result = fn()
-        logger.info(f"ai.action - {self._action} - {result}")
-        return result
+    ROLE = "ai"
+    ACTION_MAP = {
+        "generate": "_generate",
+        "markers": "_markers",
+    }
+
+    def build_service(self):
+        # pylint: disable=import-outside-toplevel
+        from .services import AIBrainService, BeatMarkerService
+
+        if self._action == "markers":
+            return BeatMarkerService(AIRegistry, settings)
+        return AIBrainService(AIRegistry, settings)
+
+    def _generate(self, svc: AIBrainService):
+        return svc.generate({})
+
+    def _markers(self, svc: BeatMarkerService):
+        return svc.markers_from_features({})
@@ -26,6 +26,8 @@ class AISettings(BaseSettings):
     """
     Settings for the AI module.
     """
+
+    __slots__ = ()
     
     name = "ai"
 
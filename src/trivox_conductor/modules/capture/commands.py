@@ -26,7 +26,7 @@ This module defines CLI shape only; business logic and I/O are handled by the
 processor and service layers.
 """
 
-from trivox_conductor.common.logger import logger
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.common.base_command import TrivoxConductorCommand
 from trivox_conductor.common.commands.base_command import register_command
 from trivox_conductor.common.commands.argument_type import ArgumentType
@@ -80,6 +80,8 @@ class CaptureCommand(TrivoxConductorCommand):
 
     def _execute(self, **kwargs):
         # Implement the command execution logic here
-        logger.debug(f"Executing CaptureCommand with kwargs: {kwargs}")
+        get_class_logger(self).debug(
+            "Executing CaptureCommand with kwargs: %s", kwargs
+        )
         self.set_processor(CaptureCommandProcessor)
         self._run(**kwargs)
@@ -21,21 +21,33 @@ Design notes
 
 from __future__ import annotations
 
-from trivox_conductor.common.logger import logger
+from typing import TYPE_CHECKING
+
 from trivox_conductor.common.settings import settings
 from trivox_conductor.common.base_processor import TrivoxCaptureCommandProcessor
 from trivox_conductor.core.registry.capture_registry import CaptureRegistry
 
-from .services import CaptureService
+if TYPE_CHECKING:
+    from .services import CaptureService
 
 
 class CaptureCommandProcessor(TrivoxCaptureCommandProcessor):
     """
     Command processor for Capture module commands.
     """
+
+    __slots__ = ("_session_id", "_scene", "_profile", "_overrides")
     
+    ROLE = "capture"
+    ACTION_MAP = {
+        "start": "_start",
+        "stop": "_stop",
+        "list_scenes": "_list_scenes",
+        "list_profiles": "_list_profiles",
+    }
+
     def __init__(self, **kwargs):
-        self._action: str = kwargs.get("action", "")
+        super().__init__(**kwargs)
         self._session_id: str = kwargs.get("session_id", None)
 
         # Optional selections
@@ -51,29 +63,26 @@ class CaptureCommandProcessor(TrivoxCaptureCommandProcessor):
                 "request_timeout_sec": kwargs.get("request_timeout_sec"),
             }.items() if v is not None
         }
-    
-    def run(self):
-        # Implement the command processing logic here
-        logger.debug("Running CaptureCommandProcessor")
-
-        svc = CaptureService(CaptureRegistry, settings)
-
-        ops = {
-            "start": lambda: svc.start(
-                self._session_id,
-                scene=self._scene,
-                profile=self._profile,
-                overrides=self._overrides
-            ),
-            "stop": lambda: svc.stop(overrides=self._overrides),
-            "list_scenes": lambda: svc.list_scenes(overrides=self._overrides),
-            "list_profiles": lambda: svc.list_profiles(overrides=self._overrides),
-        }
-        try:
-            fn = ops[self._action]
-        except KeyError as e:
-            raise ValueError(f"Unknown action: {self._action}") from e
-
-        result = fn()
-        logger.info(f"capture.action - {self._action} - {result}")
-        return result
+
+    def build_service(self):
+        # pylint: disable=import-outside-toplevel
+        from .services import CaptureService
+
+        return CaptureService(CaptureRegistry, settings)
+
+    def _start(self, svc: CaptureService):
+        return svc.start(
+            self._session_id,
+            scene=self._scene,
+            profile=self._profile,
+            overrides=self._overrides
+        )
+
+    def _stop(self, svc: CaptureService):
+        return svc.stop(overrides=self._overrides)
+
+    def _list_scenes(self, svc: CaptureService):
+        return svc.list_scenes(overrides=self._overrides)
+
+    def _list_profiles(self, svc: CaptureService):
+        return svc.list_profiles(overrides=self._overrides)
@@ -35,7 +35,7 @@ from __future__ import annotations
 
 from dataclasses import asdict
 from typing import Optional, List, Dict, Mapping, Any
-from trivox_conductor.common.logger import logger
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.core.contracts.capture import CaptureAdapter
 from trivox_conductor.core.events.bus import BUS
 from trivox_conductor.core.events import topics
@@ -117,10 +117,13 @@ class CaptureService(BaseService[CaptureSettingsModel, CaptureAdapter]):
         
         :raises RuntimeError: If preflight checks fail or no adapter is configured.
         """
+        log = get_class_logger(self)
         if not session_id:
             raise ValueError("session_id is required")
         if self._state.is_recording:
-            logger.info(f"capture.already_recording - {self._state.session_id}")
+            log.info(
+                "capture.already_recording - %s", self._state.session_id
+            )
             return
         
         cfg_dict = asdict(self._settings)
@@ -136,7 +139,7 @@ class CaptureService(BaseService[CaptureSettingsModel, CaptureAdapter]):
         if not ok:
             failures.append(f"obs: {msg}")
         else:
-            logger.debug(f"capture.preflight_ok - obs: {msg}")
+            log.debug("capture.preflight_ok - obs: %s", msg)
 
         # 2) Disk space (best effort). Resolve record dir:
         #    priority: CLI override 'record_dir' -> adapter.get_record_directory() -> skip
@@ -149,7 +152,11 @@ class CaptureService(BaseService[CaptureSettingsModel, CaptureAdapter]):
                 try:
                     record_dir = get_dir()  # expect a str
                 except Exception as e:
-                    logger.debug(f"capture.preflight_warn - get_record_directory failed: {e}")
+                    log.debug(
+                        "capture.preflight_warn - "
+                        "get_record_directory failed: %s",
+                        e,
+                    )
 
         if record_dir:
             min_gb = float(cfg_dict.get("min_record_free_gb", 5.0))
@@ -157,9 +164,12 @@ class CaptureService(BaseService[CaptureSettingsModel, CaptureAdapter]):
             if not ok:
                 failures.append(f"disk: {msg}")
             else:
-                logger.debug(f"capture.preflight_ok - disk: {msg}")
+                log.debug("capture.preflight_ok - disk: %s", msg)
         else:
-            logger.debug("capture.preflight_skip - disk: record directory unknown (override 'record_dir' to enable check)")
+            log.debug(
+                "capture.preflight_skip - disk: record directory unknown "
+                "(override 'record_dir' to enable check)"
+            )
 
         # 3) Minecraft foreground (optional strictness; default False)
         enforce_mc_fg = bool(cfg_dict.get("enforce_mc_foreground", False))
@@ -168,13 +178,15 @@ class CaptureService(BaseService[CaptureSettingsModel, CaptureAdapter]):
             if not ok:
                 failures.append(f"minecraft: {msg}")
             else:
-                logger.debug(f"capture.preflight_ok - minecraft: {msg}")
+                log.debug("capture.preflight_ok - minecraft: %s", msg)
         else:
-            logger.debug("capture.preflight_skip - minecraft: enforcement disabled")
+            log.debug(
+                "capture.preflight_skip - minecraft: enforcement disabled"
+            )
 
         if failures:
             error_msg = "Preflight failed: " + "; ".join(failures)
-            logger.error(f"capture.preflight_failed - {error_msg}")
+            log.error("capture.preflight_failed - %s", error_msg)
             raise RuntimeError(error_msg)
 
         # --- Safe to proceed: select scene/profile, then start ---
@@ -186,7 +198,12 @@ class CaptureService(BaseService[CaptureSettingsModel, CaptureAdapter]):
             if chosen_profile:
                 adapter.select_profile(chosen_profile)
         except Exception as e:
-            logger.error(f"capture.select_failed - {str(e)} - Scene: {chosen_scene}, Profile: {chosen_profile}")
+            log.error(
+                "capture.select_failed - %s - Scene: %s, Profile: %s",
+                e,
+                chosen_scene,
+                chosen_profile,
+            )
             raise
 
         adapter.start_capture()
@@ -200,6 +217,7 @@ class CaptureService(BaseService[CaptureSettingsModel, CaptureAdapter]):
 
         :raises RuntimeError: If no adapter is configured.
         """
+        log = get_class_logger(self)
         if not self._state.is_recording:
             self._state = self._store.load()
 
@@ -209,10 +227,10 @@ class CaptureService(BaseService[CaptureSettingsModel, CaptureAdapter]):
         try:
             is_recording_now = adapter.is_recording()
         except Exception as e:
-            logger.warning(f"capture.adapter_is_recording_probe_failed: {e}")
+            log.warning("capture.adapter_is_recording_probe_failed: %s", e)
 
         if not (self._state.is_recording or is_recording_now):
-            logger.info("capture.stop_ignored - not recording (memory & adapter)")
+            log.info("capture.stop_ignored - not recording (memory & adapter)")
             return
 
         # Try to stop anyway; StopRecord is idempotent on OBS side.
@@ -53,6 +53,8 @@ class CaptureSettings(BaseSettings):
     """
     Settings for the Capture module.
     """
+
+    __slots__ = ()
     
     name = "capture"
 
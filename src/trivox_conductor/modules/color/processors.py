@@ -1,34 +1,36 @@
+from __future__ import annotations
 
-from trivox_conductor.common.logger import logger
+from typing import TYPE_CHECKING
+
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.common.settings import settings
 from trivox_conductor.common.base_processor import TrivoxCaptureCommandProcessor
 from trivox_conductor.core.registry.color_registry import ColorRegistry
 
-from .services import ColorService
+if TYPE_CHECKING:
+    from .services import ColorService
 
 
 class ColorCommandProcessor(TrivoxCaptureCommandProcessor):
     """
     Command processor for Color module commands.
     """
+
+    __slots__ = ()
     
-    def __init__(self, **kwargs):
-        self._action: str = kwargs.get("action", "")
-    
-    def run(self):
-        # Implement the command processing logic here
-        logger.debug("Running ColorCommandProcessor")
-
-        svc = ColorService(ColorRegistry, settings)
-
-        ops = {
-            "color_pass": lambda: svc.color_pass(""),
-        }
-        try:
-            fn = ops[self._action]
-        except KeyError as e:
-            raise ValueError(f"Unknown action: {self._action}") from e
-
-        result = fn()
-        logger.info(f"color.action - {self._action}")
-        return result
+    ROLE = "color"
+    ACTION_MAP = {
+        "color_pass": "_color_pass",
+    }
+
+    def build_service(self):
+        # pylint: disable=import-outside-toplevel
+        from .services import ColorService
+
+        return ColorService(ColorRegistry, settings)
+
+    def _color_pass(self, svc: ColorService):
+        return svc.color_pass("")
+
+    def _log_action(self, result):
+        get_class_logger(self).info("%s.action - %s", self.ROLE, self._action)
@@ -26,6 +26,8 @@ class ColorSettings(BaseSettings):
     """
     Settings for the Color module.
     """
+
+    __slots__ = ()
     
     name = "color"
 
@@ -1,39 +1,43 @@
+from __future__ import annotations
 
-from trivox_conductor.common.logger import logger
+from typing import TYPE_CHECKING
+
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.common.settings import settings
 from trivox_conductor.common.base_processor import TrivoxCaptureCommandProcessor
 from trivox_conductor.core.registry.uploader_registry import UploaderRegistry
 from trivox_conductor.core.registry.notifier_registry import NotifierRegistry
 
-from .services import UploaderService, NotifierService
+if TYPE_CHECKING:
+    from .services import UploaderService, NotifierService
 
 
 class HandoffCommandProcessor(TrivoxCaptureCommandProcessor):
     """
     Command processor for Handoff module commands.
     """
+
+    __slots__ = ()
     
-    def __init__(self, **kwargs):
-        self._action: str = kwargs.get("action", "")
-    
-    def run(self):
-        # Implement the command processing logic here
-        logger.debug("Running HandoffCommandProcessor")
-        
-        if self._action == "upload_clip":
-            svc = UploaderService(UploaderRegistry, settings)
-        elif self._action == "notify_upload_done":
-            svc = NotifierService(NotifierRegistry, settings)
-
-        ops = {
-            "upload_clip": lambda: svc.upload_clip("", ""),
-            "notify_upload_done": lambda: svc.notify_upload_done("", ""),
-        }
-        try:
-            fn = ops[self._action]
-        except KeyError as e:
-            raise ValueError(f"Unknown action: {self._action}") from e
-
-        result = fn()
-        logger.info(f"handoff.action - {self._action}")
-        return result
+    ROLE = "handoff"
+    ACTION_MAP = {
+        "upload_clip": "_upload_clip",
+        "notify_upload_done": "_notify_upload_done",
+    }
+
+    def build_service(self):
+        # pylint: disable=import-outside-toplevel
+        from .services import UploaderService, NotifierService
+
+        if self._action == "notify_upload_done":
+            return NotifierService(NotifierRegistry, settings)
+        return UploaderService(UploaderRegistry, settings)
+
+    def _upload_clip(self, svc: UploaderService):
+        return svc.upload_clip("", "")
+
+    def _notify_upload_done(self, svc: NotifierService):
+        return svc.notify_upload_done("", "")
+
+    def _log_action(self, result):
+        get_class_logger(self).info("%s.action - %s", self.ROLE, self._action)
@@ -28,6 +28,8 @@ class HandoffSettings(BaseSettings):
     """
     Settings for the Handoff module.
     """
+
+    __slots__ = ()
     
     name = "handoff"
 
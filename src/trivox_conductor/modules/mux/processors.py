@@ -1,35 +1,42 @@
+from __future__ import annotations
 
-from trivox_conductor.common.logger import logger
+from typing import TYPE_CHECKING
+
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.common.settings import settings
 from trivox_conductor.common.base_processor import TrivoxCaptureCommandProcessor
 from trivox_conductor.core.registry.mux_registry import MuxRegistry
 
-from .services import MuxService
+if TYPE_CHECKING:
+    from .services import MuxService
 
 
 class MuxCommandProcessor(TrivoxCaptureCommandProcessor):
     """
     Command processor for Mux module commands.
     """
+
+    __slots__ = ("_session_id",)
     
+    ROLE = "mux"
+    ACTION_MAP = {
+        "mux_clip": "_mux_clip",
+    }
+
     def __init__(self, **kwargs):
-        self._action: str = kwargs.get("action", "")
+        super().__init__(**kwargs)
         self._session_id: str = kwargs.get("session_id", None)
-    
-    def run(self):
-        # Implement the command processing logic here
-        logger.debug("Running CaptureCommandProcessor")
-
-        svc = MuxService(MuxRegistry, settings)
-
-        ops = {
-            "mux_clip": lambda: svc.mux_clip("", {}, None, self._session_id),
-        }
-        try:
-            fn = ops[self._action]
-        except KeyError as e:
-            raise ValueError(f"Unknown action: {self._action}") from e
-
-        result = fn()
-        logger.info(f"mux.action - {self._action} - {self._session_id}")
-        return result
+
+    def build_service(self):
+        # pylint: disable=import-outside-toplevel
+        from .services import MuxService
+
+        return MuxService(MuxRegistry, settings)
+
+    def _mux_clip(self, svc: MuxService):
+        return svc.mux_clip("", {}, None, self._session_id)
+
+    def _log_action(self, result):
+        get_class_logger(self).info(
+            "%s.action - %s - %s", self.ROLE, self._action, self._session_id
+        )
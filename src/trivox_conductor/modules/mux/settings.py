@@ -30,6 +30,8 @@ class MuxSettings(BaseSettings):
     """
     Settings for the Mux module.
     """
+
+    __slots__ = ()
     
     name = "mux"
 
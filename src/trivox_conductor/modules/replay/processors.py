@@ -1,37 +1,50 @@
+from __future__ import annotations
 
-from trivox_conductor.common.logger import logger
+from typing import TYPE_CHECKING
+
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.common.settings import settings
 from trivox_conductor.common.base_processor import TrivoxCaptureCommandProcessor
 from trivox_conductor.core.registry.watcher_registry import WatcherRegistry
 
-from .services import ReplayWatcherService
+if TYPE_CHECKING:
+    from .services import ReplayWatcherService
 
 
 class ReplayCommandProcessor(TrivoxCaptureCommandProcessor):
     """
     Command processor for Replay module commands.
     """
+
+    __slots__ = ("_session_id",)
     
+    ROLE = "replay"
+    ACTION_MAP = {
+        "start": "_start",
+        "stop": "_stop",
+        "on_raw_detect": "_on_raw_detect",
+    }
+
     def __init__(self, **kwargs):
-        self._action: str = kwargs.get("action", "")
+        super().__init__(**kwargs)
         self._session_id: str = kwargs.get("session_id", None)
-    
-    def run(self):
-        # Implement the command processing logic here
-        logger.debug("Running ReplayCommandProcessor")
-
-        svc = ReplayWatcherService(WatcherRegistry, settings)
-
-        ops = {
-            "start": lambda: svc.start(self._session_id),
-            "stop": svc.stop,
-            "on_raw_detect": svc.on_raw_detect,
-        }
-        try:
-            fn = ops[self._action]
-        except KeyError as e:
-            raise ValueError(f"Unknown action: {self._action}") from e
-
-        result = fn()
-        logger.info(f"replay.action - {self._action} - {self._session_id}")
-        return result
+
+    def build_service(self):
+        # pylint: disable=import-outside-toplevel
+        from .services import ReplayWatcherService
+
+        return ReplayWatcherService(WatcherRegistry, settings)
+
+    def _start(self, svc: ReplayWatcherService):
+        return svc.start(self._session_id)
+
+    def _stop(self, svc: ReplayWatcherService):
+        return svc.stop()
+
+    def _on_raw_detect(self, svc: ReplayWatcherService):
+        return svc.on_raw_detect()
+
+    def _log_action(self, result):
+        get_class_logger(self).info(
+            "%s.action - %s - %s", self.ROLE, self._action, self._session_id
+        )
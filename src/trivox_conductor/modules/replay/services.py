@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 from typing import Dict, Optional
-from trivox_conductor.common.logger import logger
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.core.contracts.watcher import WatcherAdapter
 from trivox_conductor.core.events.bus import BUS
 from trivox_conductor.core.events import topics
@@ -42,7 +42,9 @@ class ReplayWatcherService(BaseService[ReplaySettingsModel, WatcherAdapter]):
         """
         adapter = self._require_adapter()
         self._configure_adapter(adapter)
-        logger.debug(f"Path to watch: {self._settings.watch_path}")
+        get_class_logger(self).debug(
+            "Path to watch: %s", self._settings.watch_path
+        )
         adapter.set_watch_path(self._settings.watch_path)
         adapter.start()
         # Real adapter would emit events; here we keep service ready for extra rules.
@@ -26,6 +26,8 @@ class ReplaySettings(BaseSettings):
     """
     Settings for the Replay module.
     """
+
+    __slots__ = ()
     
     name = "replay"
 
@@ -44,7 +44,6 @@ so that callers do not need to import SDK-specific error types.
 
 from __future__ import annotations
 
-import logging
 from typing import List, Dict, Optional
 from contextlib import suppress
 
@@ -55,8 +54,8 @@ from trivox_conductor.core.contracts.capture import CaptureAdapter
 from trivox_conductor.core.contracts.base_contract import AdapterMeta
 from trivox_conductor.core.events.bus import BUS
 from trivox_conductor.core.events import topics
+from trivox_conductor.common.logging.class_logger import get_class_logger
 
-logger = logging.getLogger(__name__)
 
 class OBSAdapter(CaptureAdapter):
     """
@@ -90,7 +89,8 @@ class OBSAdapter(CaptureAdapter):
         if self._client is not None:
             return self._client
 
-        logger.debug(f"Setting up OBS client with settings: {self._settings}")
+        log = get_class_logger(self, __name__)
+        log.debug("Setting up OBS client with settings: %s", self._settings)
         host = self._settings.get("host", "127.0.0.1")
         port = int(self._settings.get("port", 4455))
         password = self._settings.get("password", "")
@@ -100,7 +100,7 @@ class OBSAdapter(CaptureAdapter):
             self._client = obsws.ReqClient(host=host, port=port, password=password, timeout=timeout)
         except Exception as e:
             self._client = None
-            logger.error(f"OBS connect failed: {e}")
+            log.error("OBS connect failed: %s", e)
             raise RuntimeError(f"OBS connect failed: {e}") from e
 
         return self._client
@@ -132,7 +132,9 @@ class OBSAdapter(CaptureAdapter):
             items = getattr(res, "scenes", []) or []
             names = [self._extract_scene_name(it) for it in items]
             names = [n for n in names if n]  # drop Nones
-            logger.debug("OBS scenes resolved: %s", names)
+            get_class_logger(self, __name__).debug(
+                "OBS scenes resolved: %s", names
+            )
             return names
         except obs_err.OBSSDKTimeoutError as e:
             raise RuntimeError(f"GetSceneList failed: {e}") from e
@@ -2,7 +2,7 @@
 import sys
 from PySide6 import QtWidgets
 
-from trivox_conductor.common.logger import logger
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.ui.common.controllers_mediator import ControllersMediator
 from trivox_conductor.ui.common.base_window_controller import BaseWindowController
 from trivox_conductor.ui.controllers.main_window_controller import MainWindowController
@@ -26,6 +26,6 @@ class TrivoxInspectorApp(ControllersMediator):
         self._main_window_controller = MainWindowController(self)
 
     def run(self):
-        logger.info("Initializing the application...")
+        get_class_logger(self).info("Initializing the application...")
         self._main_window_controller.show()
         self._app.exec_()
@@ -1,5 +1,5 @@
 
-from trivox_conductor.common.logger import logger
+from trivox_conductor.common.logging.class_logger import get_class_logger
 from trivox_conductor.ui.common.base_window_controller import BaseWindowController
 from trivox_conductor.ui.common.controllers_mediator import ControllersMediator
 from trivox_conductor.ui.views.main_window_view import MainWindowView
@@ -27,5 +27,5 @@ class MainWindowController(BaseWindowController):
         """
 
     def show(self):
-        logger.info("Showing Main Window")
+        get_class_logger(self).info("Showing Main Window")
         self._window.show()
@@ -0,0 +1,62 @@
+"""
+Tests for the BaseCLIApp parser cache.
+"""
+
+import pytest
+
+from trivox_conductor.common.commands import BaseCLIApp, CLIConfig
+from trivox_conductor.common.commands.argument_type import ArgumentType
+from trivox_conductor.common.commands.base_command import BaseCommand
+from trivox_conductor.common.commands.registry import CommandRegistry
+
+pytestmark = pytest.mark.unit
+
+
+class _FooCommand(BaseCommand):
+    """Echo the ``x`` argument."""
+
+    name = "foo"
+    args = (
+        ArgumentType(name="x", data_type=str, help_text="X", env="FOO_X"),
+    )
+
+    def _run(self, **kwargs):
+        return kwargs["x"]
+
+    def _execute(self, **kwargs):
+        return self._run(**kwargs)
+
+
+@pytest.fixture
+def foo_command():
+    CommandRegistry.register("foo", _FooCommand)
+    yield _FooCommand
+    CommandRegistry.unregister("foo")
+
+
+def test_env_default_is_read_on_every_parse(foo_command, monkeypatch):
+    config = CLIConfig(app_name="test")
+    monkeypatch.setenv("FOO_X", "first")
+    assert BaseCLIApp(config).parse_args(["foo"]).x == "first"
+
+    monkeypatch.setenv("FOO_X", "second")
+    assert BaseCLIApp(config).parse_args(["foo"]).x == "second"
+
+    monkeypatch.delenv("FOO_X")
+    assert BaseCLIApp(config).parse_args(["foo"]).x is None
+
+
+def test_command_line_value_wins_over_env(foo_command, monkeypatch):
+    monkeypatch.setenv("FOO_X", "env")
+    app = BaseCLIApp(CLIConfig(app_name="test"))
+    assert app.parse_args(["foo", "--x", "cli"]).x == "cli"
+
+
+def test_version_fast_path_matches_argparse(capsys):
+    app = BaseCLIApp(CLIConfig(app_name="test", version="%(prog)s 1.2.3"))
+    assert app.run(["--version"]) == 0
+    fast = capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        app.parse_args(["-v", "--version"])
+    assert capsys.readouterr().out == fast == "test 1.2.3\n"
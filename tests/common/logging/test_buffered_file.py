@@ -0,0 +1,88 @@
+"""
+Tests for the BufferedFallbackHandler.
+"""
+
+import logging
+import os
+import time
+
+import pytest
+
+from trivox_conductor.common.logging.handlers import BufferedFallbackHandler
+
+pytestmark = pytest.mark.unit
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": msg, "levelno": logging.INFO})
+
+
+def _handler(path, **kwargs) -> BufferedFallbackHandler:
+    handler = BufferedFallbackHandler(str(path), **kwargs)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def _read(path) -> str:
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def test_rotates_past_max_bytes(tmp_path):
+    path = tmp_path / "fallback.log"
+    handler = _handler(path, max_bytes=100, backup_count=2, flush_interval=60)
+    # 40 bytes per line: two lines fit, the third rotates
+    lines = [f"{i}" * 39 for i in range(5)]
+    for line in lines:
+        handler.emit(_record(line))
+    handler.close()
+
+    assert _read(path) == f"{lines[4]}\n"
+    assert _read(f"{path}.1") == f"{lines[2]}\n{lines[3]}\n"
+    assert _read(f"{path}.2") == f"{lines[0]}\n{lines[1]}\n"
+    assert not os.path.exists(f"{path}.3")
+
+
+def test_no_rotation_without_backups(tmp_path):
+    path = tmp_path / "fallback.log"
+    handler = _handler(path, max_bytes=10, backup_count=0, flush_interval=60)
+    for i in range(3):
+        handler.emit(_record(f"line {i}"))
+    handler.close()
+
+    assert _read(path) == "line 0\nline 1\nline 2\n"
+    assert not os.path.exists(f"{path}.1")
+
+
+def test_buffers_until_close(tmp_path):
+    path = tmp_path / "fallback.log"
+    handler = _handler(path, flush_interval=60)
+    handler.emit(_record("buffered"))
+
+    assert _read(path) == ""  # opened on the first record, not yet flushed
+    handler.close()
+    assert _read(path) == "buffered\n"
+
+
+def test_flushes_after_interval(tmp_path):
+    path = tmp_path / "fallback.log"
+    handler = _handler(path, flush_interval=0.05)
+    try:
+        handler.emit(_record("timed"))
+        deadline = time.monotonic() + 5
+        while _read(path) != "timed\n" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _read(path) == "timed\n"
+    finally:
+        handler.close()
+
+
+def test_appends_to_existing_file(tmp_path):
+    path = tmp_path / "fallback.log"
+    path.write_text("old\n", encoding="utf-8")
+    handler = _handler(path, max_bytes=8, backup_count=1, flush_interval=60)
+    handler.emit(_record("new"))
+    handler.close()
+
+    # The size on disk counts toward max_bytes: "old\n" + "new\n" fits
+    assert _read(path) == "old\nnew\n"
@@ -0,0 +1,126 @@
+"""
+Tests for the LogSubscriber: weakly held bound methods and channel routing.
+"""
+
+import gc
+import logging
+
+import pytest
+
+from trivox_conductor.common.logging import log_subscriber as module
+from trivox_conductor.common.logging.log_subscriber import LogSubscriber
+
+pytestmark = pytest.mark.unit
+
+
+class _Sink:
+    def __init__(self):
+        self.messages = []
+
+    def write(self, message: str):
+        self.messages.append(message)
+
+
+@pytest.fixture
+def subscriber():
+    # LogSubscriber is a process-wide singleton: start empty, then restore.
+    sub = LogSubscriber()
+    saved = (sub._subs, sub._channels, sub._routes)
+    sub._subs, sub._channels, sub._routes = (), {}, {}
+    yield sub
+    sub._subs, sub._channels, sub._routes = saved
+
+
+def test_is_a_singleton(subscriber):
+    assert LogSubscriber() is subscriber
+
+
+def test_collected_bound_method_is_dropped(subscriber):
+    sink = _Sink()
+    subscriber.subscribe(sink.write)
+    subscriber.notify("before")
+    assert sink.messages == ["before"]
+
+    del sink
+    gc.collect()
+
+    assert not subscriber
+    assert subscriber.subscribers == ()
+    subscriber.notify("after")  # nothing left to call, and no error
+
+
+def test_collected_channel_subscriber_is_dropped(subscriber):
+    sink = _Sink()
+    subscriber.subscribe(sink.write, channels=["qt"])
+    assert subscriber.has_listeners("qt")
+
+    del sink
+    gc.collect()
+
+    assert not subscriber.has_listeners("qt")
+    assert not subscriber
+
+
+def test_plain_callables_are_held_strongly(subscriber):
+    received = []
+    subscriber.subscribe(lambda message: received.append(message))
+    gc.collect()
+
+    subscriber.notify("kept")
+    assert received == ["kept"]
+
+
+def test_channel_routing(subscriber):
+    everything, qt_only, console_only = _Sink(), _Sink(), _Sink()
+    subscriber.subscribe(everything.write)
+    subscriber.subscribe(qt_only.write, channels=["qt"])
+    subscriber.subscribe(console_only.write, channels=["console"])
+
+    subscriber.notify("to qt", "qt")
+    subscriber.notify("to console", "console")
+    subscriber.notify("untagged")
+    subscriber.notify("to other", "other")
+
+    assert everything.messages == [
+        "to qt",
+        "to console",
+        "untagged",
+        "to other",
+    ]
+    assert qt_only.messages == ["to qt"]
+    assert console_only.messages == ["to console"]
+
+
+def test_has_listeners_per_channel(subscriber):
+    sink = _Sink()
+    assert not subscriber.has_listeners("qt")
+
+    subscriber.subscribe(sink.write, channels=["qt"])
+    assert subscriber.has_listeners("qt")
+    assert not subscriber.has_listeners("console")
+    assert not subscriber.has_listeners()
+
+    subscriber.subscribe(sink.write)
+    assert subscriber.has_listeners("console")
+    assert subscriber.has_listeners()
+
+
+def test_failing_subscriber_does_not_stop_others(subscriber, caplog):
+    sink = _Sink()
+
+    def broken(message):
+        raise RuntimeError(message)
+
+    subscriber.subscribe(broken)
+    subscriber.subscribe(sink.write)
+    # The module logger does not propagate: listen on it directly
+    module._logger.addHandler(caplog.handler)
+    try:
+        subscriber.notify("still delivered")
+    finally:
+        module._logger.removeHandler(caplog.handler)
+
+    assert sink.messages == ["still delivered"]
+    (report,) = caplog.records
+    assert report.levelno == logging.ERROR
+    assert report.exc_info[0] is RuntimeError
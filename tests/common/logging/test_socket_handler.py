@@ -0,0 +1,190 @@
+"""
+Tests for the socket log handlers: wire formats, requeue and overflow.
+"""
+
+import logging
+import pickle
+import socket
+import struct
+
+import pytest
+
+from trivox_conductor.common.logging.handlers import (
+    RobustSocketLogger,
+    SocketLogger,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _record(msg: str, *args) -> logging.LogRecord:
+    return logging.makeLogRecord(
+        {"msg": msg, "args": args or None, "levelno": logging.INFO}
+    )
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        assert chunk, "connection closed mid-frame"
+        data += chunk
+    return data
+
+
+def _recv_frames(server: socket.socket, count: int) -> list:
+    conn, _ = server.accept()
+    with conn:
+        conn.settimeout(5)
+        frames = []
+        for _ in range(count):
+            (size,) = struct.unpack(">L", _recv_exact(conn, 4))
+            frames.append(_recv_exact(conn, size))
+        return frames
+
+
+@pytest.fixture
+def server():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(1)
+    sock.settimeout(5)
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def closed_port() -> int:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def _fallback_lines(path) -> list:
+    with open(path, encoding="utf-8") as file:
+        return [line.rsplit("] ", 1)[-1] for line in file.read().splitlines()]
+
+
+def test_robust_pickle_round_trip(server):
+    handler = RobustSocketLogger(*server.getsockname(), backoff_min=0.01)
+    try:
+        for i in range(3):
+            handler.emit(_record("message %d", i))
+        frames = _recv_frames(server, 3)
+    finally:
+        handler.close()
+
+    records = [logging.makeLogRecord(pickle.loads(f)) for f in frames]
+    assert [r.getMessage() for r in records] == [
+        "message 0",
+        "message 1",
+        "message 2",
+    ]
+    assert all(r.args is None for r in records)
+
+
+def test_robust_msgpack_round_trip(server):
+    msgpack = pytest.importorskip("msgpack")
+    handler = RobustSocketLogger(
+        *server.getsockname(), backoff_min=0.01, wire_format="msgpack"
+    )
+    record = _record("hello %s", "world")
+    record.classname = "Widget"
+    try:
+        handler.emit(record)
+        (frame,) = _recv_frames(server, 1)
+    finally:
+        handler.close()
+
+    payload = msgpack.unpackb(frame)
+    assert payload["m"] == "hello world"
+    assert payload["l"] == logging.INFO
+    assert payload["c"] == "Widget"
+    assert set(payload) == {"l", "n", "m", "t", "p", "f", "ln", "c"}
+
+
+def test_socket_logger_pickle_round_trip(server):
+    handler = SocketLogger(*server.getsockname())
+    try:
+        handler.emit(_record("plain %s", "args"))
+        (frame,) = _recv_frames(server, 1)
+    finally:
+        handler.close()
+
+    assert pickle.loads(frame).getMessage() == "plain args"
+
+
+def test_socket_logger_msgpack_round_trip(server):
+    msgpack = pytest.importorskip("msgpack")
+    handler = SocketLogger(*server.getsockname(), wire_format="msgpack")
+    try:
+        handler.emit(_record("packed"))
+        (frame,) = _recv_frames(server, 1)
+    finally:
+        handler.close()
+
+    assert msgpack.unpackb(frame)["m"] == "packed"
+
+
+def test_unknown_wire_format_is_rejected():
+    with pytest.raises(ValueError):
+        SocketLogger("127.0.0.1", 9, wire_format="json")
+
+
+def test_overflow_evicts_oldest_to_fallback(tmp_path, closed_port):
+    fallback = tmp_path / "fallback.log"
+    handler = RobustSocketLogger(
+        "127.0.0.1",
+        closed_port,
+        queue_maxsize=2,
+        fallback_file=str(fallback),
+        backoff_min=0.01,
+        backoff_max=0.01,
+    )
+    try:
+        # Nothing is taken from the queue while the server is unreachable
+        for i in range(5):
+            handler.emit(_record(f"record {i}"))
+        queued = [r.getMessage() for r in handler._dq]
+    finally:
+        handler.close()
+
+    assert queued == ["record 3", "record 4"]
+    assert _fallback_lines(fallback) == ["record 0", "record 1", "record 2"]
+
+
+def test_requeue_restores_order_at_head(closed_port):
+    handler = RobustSocketLogger(
+        "127.0.0.1", closed_port, queue_maxsize=5, backoff_min=0.01
+    )
+    try:
+        handler.emit(_record("queued"))
+        handler._requeue([_record("first"), _record("second")])
+        queued = [r.getMessage() for r in handler._dq]
+    finally:
+        handler.close()
+
+    assert queued == ["first", "second", "queued"]
+
+
+def test_requeue_overflow_goes_to_fallback(tmp_path, closed_port):
+    fallback = tmp_path / "fallback.log"
+    handler = RobustSocketLogger(
+        "127.0.0.1",
+        closed_port,
+        queue_maxsize=2,
+        fallback_file=str(fallback),
+        backoff_min=0.01,
+    )
+    try:
+        handler.emit(_record("queued"))
+        handler._requeue([_record("first"), _record("second")])
+        queued = [r.getMessage() for r in handler._dq]
+    finally:
+        handler.close()
+
+    # The tail of the batch is kept next to the queue; the rest overflows
+    assert queued == ["second", "queued"]
+    assert _fallback_lines(fallback) == ["first"]